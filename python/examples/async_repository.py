@@ -8,7 +8,6 @@ Build with: `maturin develop --features=async`
 
 import asyncio
 import tempfile
-import shutil
 import os
 
 # Import the async Repository class
@@ -23,9 +22,7 @@ except ImportError:
 async def main():
     """Demonstrate basic async repository operations."""
     # Create a temporary directory for our repository
-    temp_dir = tempfile.mkdtemp()
-
-    try:
+    with tempfile.TemporaryDirectory() as temp_dir:
         print(f"Creating repository in {temp_dir}")
 
         # Initialize a new repository
@@ -51,10 +48,10 @@ async def main():
             print(f"HEAD not set: {e}")
 
         # Get all references
-        refs = await repo.references()
-        print(f"References: {len(refs)}")
-        for ref in refs:
-            print(f"  - {ref.name} -> {ref.target} (symbolic: {ref.is_symbolic})")
+        names, targets, symbolic = await repo.references_columns()
+        print(f"References: {len(names)}")
+        for name, target, is_symbolic in zip(names, targets, symbolic):
+            print(f"  - {name} -> {target} (symbolic: {is_symbolic})")
 
         # Create a symbolic reference
         try:
@@ -80,7 +77,7 @@ async def main():
 
         # Run multiple async operations concurrently
         print("\nRunning multiple async operations concurrently...")
-        results = await asyncio.gather(
+        results = await gather(
             repo.shallow_commits(),
             repo.references(),
             repo.reference_names()
@@ -88,12 +85,34 @@ async def main():
 
         print(f"Gathered results: {len(results)} operations completed")
 
-    finally:
-        # Clean up
-        shutil.rmtree(temp_dir)
-        print(f"Cleaned up {temp_dir}")
+
+async def gather(*aws):
+    """Await several awaitables concurrently and return their results in order.
+
+    Uses a TaskGroup where available (Python 3.11+), which cancels the
+    remaining operations as soon as one fails; falls back to asyncio.gather.
+    """
+    if not hasattr(asyncio, "TaskGroup"):
+        return await asyncio.gather(*aws)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(aw) for aw in aws]
+    return [task.result() for task in tasks]
+
+
+def run(coro):
+    """Run a coroutine, letting tasks start eagerly where supported.
+
+    With an eager task factory (Python 3.12+), tasks whose gitoxide call
+    completes without suspending finish inline instead of taking an extra
+    trip through the event loop.
+    """
+    if hasattr(asyncio, "eager_task_factory"):
+        with asyncio.Runner() as runner:
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            return runner.run(coro)
+    return asyncio.run(coro)
 
 
 if __name__ == "__main__":
     # Run the async main function
-    asyncio.run(main())
+    run(main())
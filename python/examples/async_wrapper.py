@@ -59,5 +59,14 @@ async def main():
         except Exception as e:
             print(f"Failed to create reference: {e}")
 
+def run(coro):
+    """Run a coroutine with an eager task factory on Python 3.12+."""
+    if hasattr(asyncio, "eager_task_factory"):
+        with asyncio.Runner() as runner:
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            return runner.run(coro)
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
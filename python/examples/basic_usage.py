@@ -25,10 +25,13 @@ def main():
     except Exception as e:
         print(f"\nCould not open current directory as a repository: {e}")
 
-    # Example 2: Create a new repository
-    with tempfile.TemporaryDirectory() as temp_dir:
-        print(f"\nCreating a new repository in {temp_dir}")
-        new_repo = gitoxide.Repository.init(temp_dir, bare=False)
+    # Examples 2 and 3 share one temporary directory
+    with tempfile.TemporaryDirectory() as root:
+        # Example 2: Create a new repository
+        repo_path = os.path.join(root, "normal")
+        os.mkdir(repo_path)
+        print(f"\nCreating a new repository in {repo_path}")
+        new_repo = gitoxide.Repository.init(repo_path, bare=False)
         print(f"  Git directory: {new_repo.git_dir()}")
         print(f"  Working directory: {new_repo.work_dir()}")
         print(f"  Is bare: {new_repo.is_bare()}")
@@ -39,9 +42,9 @@ def main():
         except Exception as e:
             print(f"  HEAD not set in new repository: {e}")
 
-    # Example 3: Create a bare repository
-    with tempfile.TemporaryDirectory() as temp_dir:
-        bare_path = os.path.join(temp_dir, "bare-repo.git")
+        # Example 3: Create a bare repository
+        bare_path = os.path.join(root, "bare-repo.git")
+        os.mkdir(bare_path)
         print(f"\nCreating a bare repository in {bare_path}")
         bare_repo = gitoxide.Repository.init(bare_path, bare=True)
         print(f"  Git directory: {bare_repo.git_dir()}")
@@ -12,8 +12,11 @@ values from a Git repository.
 import os
 import sys
 import argparse
+from collections import Counter
 import gitoxide
 
+BRANCH_PREFIX = "refs/heads/"
+
 
 def display_section(title):
     """Display a section title with formatting."""
@@ -22,20 +25,52 @@ def display_section(title):
     print(f"{'-' * 80}")
 
 
+def _fmt_none(key, value, indent_str):
+    return f"{indent_str}{key} = <not set>\n"
+
+
+def _fmt_list(key, value, indent_str):
+    if not value:
+        return f"{indent_str}{key} = <empty list>\n"
+    lines = [f"{indent_str}{key} = <{len(value)} values>\n"]
+    lines.extend(f"{indent_str}  {i}: {val}\n" for i, val in enumerate(value))
+    return "".join(lines)
+
+
+def _fmt_scalar(key, value, indent_str):
+    return f"{indent_str}{key} = {value}\n"
+
+
+# Formatters keyed on the exact value type; anything else is a scalar
+_FMT = {list: _fmt_list, type(None): _fmt_none}
+
+
+def format_config_value(key, value, indent=2):
+    """Format a configuration key-value pair as newline-terminated text."""
+    return _FMT.get(type(value), _fmt_scalar)(key, value, " " * indent)
+
+
 def display_config_value(key, value, indent=2):
     """Display a configuration key-value pair with proper indentation."""
-    indent_str = " " * indent
-    if value is None:
-        print(f"{indent_str}{key} = <not set>")
-    elif isinstance(value, list):
-        if not value:
-            print(f"{indent_str}{key} = <empty list>")
-        else:
-            print(f"{indent_str}{key} = <{len(value)} values>")
-            for i, val in enumerate(value):
-                print(f"{indent_str}  {i}: {val}")
-    else:
-        print(f"{indent_str}{key} = {value}")
+    sys.stdout.write(format_config_value(key, value, indent))
+
+
+def _as_bool(value):
+    """Interpret a Git boolean string, or return None if it isn't one."""
+    lowered = value.lower()
+    if lowered in ("true", "yes", "on", "1"):
+        return True
+    if lowered in ("false", "no", "off", "0", ""):
+        return False
+    return None
+
+
+def _as_int(value):
+    """Interpret a plain Git integer string, or return None if it isn't one."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
 
 
 def explore_config(repo_path):
@@ -48,67 +83,91 @@ def explore_config(repo_path):
         print(f"  Working directory: {repo.work_dir() or '<bare repository>'}")
         print(f"  Is bare: {repo.is_bare()}")
 
-        # Access configuration
+        # Access configuration, fetching the common entries only once
         config = repo.config()
+        entries = config.entries()
+
+        def lookup(key, convert, fallback):
+            """Serve a key from the cached entries, asking config otherwise."""
+            value = entries.get(key)
+            if value is not None:
+                converted = convert(value)
+                if converted is not None:
+                    return converted
+            return fallback(key)
+
+        def string(key):
+            return lookup(key, str, config.string)
+
+        def boolean(key):
+            return lookup(key, _as_bool, config.boolean)
+
+        def integer(key):
+            return lookup(key, _as_int, config.integer)
 
         # Display user information
         display_section("User Information")
-        display_config_value("user.name", config.string("user.name"))
-        display_config_value("user.email", config.string("user.email"))
-        display_config_value(
-            "user.signingkey", config.string("user.signingkey"))
+        display_config_value("user.name", string("user.name"))
+        display_config_value("user.email", string("user.email"))
+        display_config_value("user.signingkey", string("user.signingkey"))
 
         # Display core settings
         display_section("Core Settings")
-        display_config_value("core.bare", config.boolean("core.bare"))
-        display_config_value("core.filemode", config.boolean("core.filemode"))
-        display_config_value(
-            "core.ignorecase", config.boolean("core.ignorecase"))
-        display_config_value("core.compression",
-                             config.integer("core.compression"))
-        display_config_value("core.editor", config.string("core.editor"))
-        display_config_value("core.pager", config.string("core.pager"))
+        display_config_value("core.bare", boolean("core.bare"))
+        display_config_value("core.filemode", boolean("core.filemode"))
+        display_config_value("core.ignorecase", boolean("core.ignorecase"))
+        display_config_value("core.compression", integer("core.compression"))
+        display_config_value("core.editor", string("core.editor"))
+        display_config_value("core.pager", string("core.pager"))
 
         # Display branch information
         display_section("Branch Information")
         try:
-            head_ref = repo.head().split("/")[-1]
+            head_ref = repo.head()
+            if head_ref.startswith(BRANCH_PREFIX):
+                head_ref = head_ref[len(BRANCH_PREFIX):]
             display_config_value(f"Current HEAD", head_ref)
-            display_config_value(f"branch.{head_ref}.remote", config.string(
-                f"branch.{head_ref}.remote"))
-            display_config_value(f"branch.{head_ref}.merge", config.string(
-                f"branch.{head_ref}.merge"))
+            display_config_value(f"branch.{head_ref}.remote",
+                                 string(f"branch.{head_ref}.remote"))
+            display_config_value(f"branch.{head_ref}.merge",
+                                 string(f"branch.{head_ref}.merge"))
         except Exception as e:
             print(f"  Error accessing HEAD: {e}")
 
         # Display remote information
         display_section("Remote Information")
-        # First, gather remote names from the entries
-        remotes = set()
-        all_entries = config.entries()
-        for key in all_entries.keys():
-            if key.startswith("remote.") and "." in key[7:]:
-                remote_name = key.split(".")[1]
-                remotes.add(remote_name)
-
-        # Display information for each remote
+        # First, gather remote names straight from the remote sections
+        remotes = config.section_subsections("remote")
+
+        # Display information for each remote. Config objects are bound to the
+        # thread that created them and read an in-memory snapshot, so these
+        # lookups stay sequential rather than being farmed out to threads.
         for remote in sorted(remotes):
             print(f"  Remote: {remote}")
-            display_config_value(f"remote.{remote}.url", config.string(
-                f"remote.{remote}.url"), indent=4)
+            display_config_value(f"remote.{remote}.url",
+                                 string(f"remote.{remote}.url"), indent=4)
+            # Multi-valued keys still need to go through config
             fetch_values = config.values(f"remote.{remote}.fetch")
             display_config_value(
                 f"remote.{remote}.fetch", fetch_values, indent=4)
 
         # Display all config entries
         display_section("All Configuration Entries")
-        entries = config.entries()
         if entries:
-            for key in sorted(entries.keys()):
-                display_config_value(key, entries[key])
+            # Build the whole listing first and write it out in one go
+            sys.stdout.write("".join(
+                format_config_value(key, value)
+                for key, value in sorted(entries.items())
+            ))
         else:
             print("  No configuration entries found")
 
+        # Summarise how many entries each section contributes, in one pass
+        display_section("Entries per Section")
+        section_counts = Counter(key.partition(".")[0] for key in entries)
+        for section, count in sorted(section_counts.items()):
+            display_config_value(section, count)
+
     except Exception as e:
         print(f"Error: {e}")
         return 1
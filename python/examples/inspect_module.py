@@ -14,8 +14,8 @@ try:
     print("\nSuccessfully imported gitoxide")
     print("Version:", gitoxide.__version__)
     print("\nModule attributes:")
-    for attr in dir(gitoxide):
+    for attr, value in sorted(vars(gitoxide).items()):
         if not attr.startswith('__'):
-            print(f"  - {attr}: {type(getattr(gitoxide, attr))}")
+            print(f"  - {attr}: {type(value).__name__}")
 except ImportError as e:
     print(f"Failed to import gitoxide: {e}")
\ No newline at end of file
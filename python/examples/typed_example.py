@@ -10,9 +10,22 @@ and static type checking.
 import os
 import sys
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 
 
+def _open(abs_path: str) -> Any:
+    """
+    Open a repository by its canonical path.
+
+    Repository handles may only be used by the thread that created them, so
+    every worker opens its own instead of sharing a cached one.
+    """
+    import gitoxide
+
+    return gitoxide.Repository.open(abs_path)
+
+
 def get_repo_info(repo_path: str) -> Dict[str, Any]:
     """
     Get information about a Git repository with proper typing.
@@ -30,7 +43,7 @@ def get_repo_info(repo_path: str) -> Dict[str, Any]:
 
     try:
         # Open the repository - IDE will know this returns a Repository object
-        repo = gitoxide.Repository.open(repo_path)
+        repo = _open(os.path.realpath(repo_path))
 
         # Collect information - IDE will know the return types of these methods
         info = {
@@ -63,16 +76,18 @@ def process_repositories(paths: List[str]) -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping repository paths to their information
     """
-    results: Dict[str, Dict[str, Any]] = {}
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        return dict(zip(paths, executor.map(_safe_get_repo_info, paths)))
 
-    for path in paths:
-        try:
-            info = get_repo_info(path)
-            results[path] = info
-        except Exception as e:
-            results[path] = {"error": str(e)}
 
-    return results
+def _safe_get_repo_info(path: str) -> Dict[str, Any]:
+    """Like get_repo_info(), but report failures as an "error" entry."""
+    try:
+        return get_repo_info(path)
+    except Exception as e:
+        return {"error": str(e)}
 
 
 def create_test_repo(path: str) -> Optional[str]:
@@ -124,7 +139,7 @@ def main() -> int:
         # Try to add the current directory if it's a Git repository
         try:
             current_dir = os.getcwd()
-            gitoxide.Repository.open(current_dir)
+            _open(os.path.realpath(current_dir))
             repos_to_check.append(current_dir)
         except Exception:
             pass
@@ -9,11 +9,24 @@ be used, but doesn't actually need the gitoxide package to be installed.
 import os
 import sys
 import pathlib
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 
+# dataclass(slots=...) needs Python 3.10; older interpreters fall back to __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
+
+@dataclass(frozen=True, **_SLOTS)
 class MockRepository:
-    """Mock Repository class for demonstration purposes."""
+    """Mock Repository class for demonstration purposes.
+
+    The mock is stateless and immutable, so it stays cheap enough to use as a
+    baseline when comparing against the native Repository.
+    """
+
+    _git_dir: str = "/path/to/.git"
+    _work_dir: Optional[str] = "/path/to/working/dir"
+    _head: str = "refs/heads/main"
 
     @classmethod
     def open(cls, path: str) -> "MockRepository":
@@ -21,6 +34,16 @@ class MockRepository:
         print(f"Opening repository at {path}")
         return cls()
 
+    @classmethod
+    def open_bare(cls, path: str) -> "MockRepository":
+        """Mock open_bare method.
+
+        Prefer this over open() when `path` is known to be the git directory:
+        it skips probing for `.git` and loads only the repository's own config.
+        """
+        print(f"Opening repository at git directory {path}")
+        return cls()
+
     @classmethod
     def init(cls, path: str, bare: bool = False) -> "MockRepository":
         """Mock init method."""
@@ -29,11 +52,11 @@ class MockRepository:
 
     def git_dir(self) -> str:
         """Mock git_dir method."""
-        return "/path/to/.git"
+        return self._git_dir
 
     def work_dir(self) -> Optional[str]:
         """Mock work_dir method."""
-        return "/path/to/working/dir"
+        return self._work_dir
 
     def is_bare(self) -> bool:
         """Mock is_bare method."""
@@ -41,7 +64,7 @@ class MockRepository:
 
     def head(self) -> str:
         """Mock head method."""
-        return "refs/heads/main"
+        return self._head
 
 
 def get_repo_info(repo_path: str) -> Dict[str, Any]:
@@ -6,37 +6,54 @@ This script combines functionality from various test scripts to provide
 a comprehensive test of the gitoxide Python bindings.
 """
 
+import asyncio
 import os
+import shutil
 import sys
 import tempfile
-import subprocess
 import argparse
+import functools
 import importlib
+import itertools
+import operator
 from typing import Optional, Dict, Any, List
 
 
-def print_separator(char='-', length=70):
-    """Print a separator line."""
-    print(char * length)
+SEPARATOR = '=' * 70
+
+# The repository this script lives in, used when no path is given
+DEFAULT_REPO_PATH = os.path.abspath(os.path.dirname(
+    os.path.dirname(os.path.dirname(__file__))))
+
+
+def print_header(title):
+    """Print a section title framed by separator lines in a single write."""
+    print(f"{SEPARATOR}\n{title}\n{SEPARATOR}")
+
+
+@functools.lru_cache(maxsize=16)
+def open_repository(repo_path):
+    """Open a repository once per absolute path and reuse the handle."""
+    import gitoxide
+
+    return gitoxide.Repository.open(repo_path)
 
 
 def test_basic_import():
     """Test basic import of gitoxide."""
-    print_separator('=')
-    print("TESTING BASIC IMPORT")
-    print_separator('=')
+    print_header("TESTING BASIC IMPORT")
 
     try:
         import gitoxide
         print("Successfully imported gitoxide")
         print(f"Version: {gitoxide.__version__}")
-        print(f"Available attributes: {', '.join(sorted(dir(gitoxide)))}")
+        print(f"Available attributes: {', '.join(gitoxide.__all__)}")
 
         # Check for asyncio module
         if hasattr(gitoxide, 'asyncio'):
             print("\nAsyncio module is available")
             print(
-                f"Asyncio attributes: {', '.join(sorted(dir(gitoxide.asyncio)))}")
+                f"Asyncio attributes: {', '.join(gitoxide.asyncio.__all__)}")
         else:
             print("\nAsyncio module is NOT available")
 
@@ -45,7 +62,7 @@ def test_basic_import():
             asyncio_module = importlib.import_module('gitoxide.asyncio')
             print("\nSuccessfully imported gitoxide.asyncio with importlib")
             print(
-                f"Available attributes: {', '.join(sorted(dir(asyncio_module)))}")
+                f"Available attributes: {', '.join(asyncio_module.__all__)}")
         except ImportError as e:
             print(f"\nFailed to import gitoxide.asyncio with importlib: {e}")
 
@@ -57,40 +74,18 @@ def test_basic_import():
 
 def test_error_types():
     """Test that all error types are accessible."""
-    print_separator('=')
-    print("TESTING ERROR TYPES")
-    print_separator('=')
+    print_header("TESTING ERROR TYPES")
 
     import gitoxide
+    import gitoxide.errors
 
-    # Directly check for expected error types
-    expected_error_names = [
-        "GitoxideError",
-        "RepositoryError",
-        "ObjectError",
-        "ReferenceError",
-        "ConfigError",
-        "IndexError",
-        "DiffError",
-        "TraverseError",
-        "WorktreeError",
-        "RevisionError",
-        "RemoteError",
-        "TransportError",
-        "ProtocolError",
-        "PackError",
-        "FSError"
-    ]
-
-    error_types = []
-    for name in expected_error_names:
-        if hasattr(gitoxide, name):
-            error_type = getattr(gitoxide, name)
-            if isinstance(error_type, type) and issubclass(error_type, Exception):
-                error_types.append(error_type)
+    # gitoxide.errors lists all error types in __all__; resolve them in one call
+    expected = gitoxide.errors.__all__
+    error_types = [value for value in operator.attrgetter(*expected)(gitoxide.errors)
+                   if isinstance(value, type) and issubclass(value, Exception)]
 
     print(
-        f"Found {len(error_types)} of {len(expected_error_names)} expected error types:")
+        f"Found {len(error_types)} of {len(expected)} expected error types:")
     for error_type in sorted(error_types, key=lambda t: t.__name__):
         print(f"  - {error_type.__name__}")
 
@@ -117,23 +112,30 @@ def test_error_types():
     return len(error_types) > 0
 
 
-def test_repository_info(repo_path=None):
-    """Test basic repository information functions."""
-    print_separator('=')
-    print("TESTING REPOSITORY INFO")
-    print_separator('=')
+def test_repository_info(repo_path=None, open_mode="discover"):
+    """Test basic repository information functions.
+
+    With open_mode="bare" the repository is opened with open_bare(), which
+    takes the git directory as-is and loads only its own configuration.
+    """
+    print_header("TESTING REPOSITORY INFO")
 
     import gitoxide
 
     if repo_path is None:
-        repo_path = os.path.abspath(os.path.dirname(
-            os.path.dirname(os.path.dirname(__file__))))
+        repo_path = DEFAULT_REPO_PATH
 
     print(f"Opening repository at: {repo_path}")
 
     try:
         # Open the repository
-        repo = gitoxide.Repository.open(repo_path)
+        if open_mode == "bare":
+            git_dir = os.path.join(repo_path, ".git")
+            if not os.path.isdir(git_dir):
+                git_dir = repo_path
+            repo = gitoxide.Repository.open_bare(os.path.abspath(git_dir))
+        else:
+            repo = open_repository(os.path.abspath(repo_path))
 
         # Basic repository information
         print(f"Git directory: {repo.git_dir()}")
@@ -166,35 +168,33 @@ def test_repository_info(repo_path=None):
 
 def test_references(repo_path=None):
     """Test repository reference functions."""
-    print_separator('=')
-    print("TESTING REFERENCES")
-    print_separator('=')
+    print_header("TESTING REFERENCES")
 
     import gitoxide
 
     if repo_path is None:
-        repo_path = os.path.abspath(os.path.dirname(
-            os.path.dirname(os.path.dirname(__file__))))
+        repo_path = DEFAULT_REPO_PATH
 
     print(f"Opening repository at: {repo_path}")
 
     try:
         # Open the repository
-        repo = gitoxide.Repository.open(repo_path)
+        repo = open_repository(os.path.abspath(repo_path))
 
         if not hasattr(repo, 'references'):
             print("Method 'references' not available")
             return False
 
         # List all references
-        refs = repo.references()
-        print(f"Found {len(refs)} references:")
-        for i, ref in enumerate(refs[:5]):  # Just print the first 5
+        ref_count = repo.reference_count()
+        print(f"Found {ref_count} references:")
+        # Just print the first 5
+        for ref in itertools.islice(repo.iter_references(), 5):
             ref_type = "symbolic" if ref.is_symbolic else "direct"
             print(f"  - {ref.name} -> {ref.target} ({ref_type})")
 
-        if len(refs) > 5:
-            print(f"  ... and {len(refs) - 5} more references")
+        if ref_count > 5:
+            print(f"  ... and {ref_count - 5} more references")
 
         # Get reference names if available
         if hasattr(repo, 'reference_names'):
@@ -224,65 +224,53 @@ def test_references(repo_path=None):
 
 def test_objects(repo_path=None):
     """Test repository object functions."""
-    print_separator('=')
-    print("TESTING OBJECTS")
-    print_separator('=')
+    print_header("TESTING OBJECTS")
 
     import gitoxide
 
     if repo_path is None:
-        repo_path = os.path.abspath(os.path.dirname(
-            os.path.dirname(os.path.dirname(__file__))))
+        repo_path = DEFAULT_REPO_PATH
 
     print(f"Opening repository at: {repo_path}")
 
     try:
         # Open the repository
-        repo = gitoxide.Repository.open(repo_path)
+        repo = open_repository(os.path.abspath(repo_path))
 
         # Skip if object methods are not available
         if not hasattr(repo, 'find_header') or not hasattr(repo, 'has_object'):
             print("Object methods not available")
             return False
 
-        # Get commit ID using git command
+        # Resolve the commit and tree IDs natively
         try:
-            commit_id = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
-                cwd=repo_path,
-                universal_newlines=True
-            ).strip()
+            commit_id = repo.rev_parse("HEAD")
+            tree_id = repo.rev_parse("HEAD^{tree}")
             print(f"HEAD commit ID: {commit_id}")
 
-            # Check if object exists
-            exists = repo.has_object(commit_id)
-            print(f"Object exists: {exists}")
+            # Check and describe both objects with one batched call each
+            ids = [commit_id, tree_id]
+            exists = repo.has_objects(ids)
+            print(f"Objects exist: {exists}")
 
-            if exists:
-                # Get object header
-                header = repo.find_header(commit_id)
-                print(
-                    f"Object header: kind={header.kind}, size={header.size} bytes")
+            if all(exists):
+                for object_id, header in zip(ids, repo.find_headers(ids)):
+                    print(f"Object header of {object_id}: kind={header.kind}, size={header.size} bytes")
 
                 # Find commit object
-                if hasattr(repo, 'find_commit'):
-                    commit = repo.find_commit(commit_id)
-                    print(f"Found commit object: {commit.id} ({commit.kind})")
-
-                # Get tree from commit
-                tree_id = subprocess.check_output(
-                    ["git", "rev-parse", "HEAD^{tree}"],
-                    cwd=repo_path,
-                    universal_newlines=True
-                ).strip()
+                commit = repo.find_commit(commit_id)
+                print(f"Found commit object: {commit.id} ({commit.kind})")
+                # Only decode the bytes that are actually shown
+                print("Commit data preview:",
+                      commit.data[:100].decode('utf-8', errors='replace'), "...")
 
                 # Find tree object
-                if hasattr(repo, 'find_tree'):
-                    tree = repo.find_tree(tree_id)
-                    print(f"Found tree object: {tree.id} ({tree.kind})")
+                tree = repo.find_tree(tree_id)
+                print(f"Found tree object: {tree.id} ({tree.kind})")
+                print("Tree data preview:", tree.data[:20].hex(), "...")
 
             return True
-        except subprocess.CalledProcessError as e:
+        except gitoxide.RepositoryError as e:
             print(f"Error getting commit ID: {e}")
             return False
     except Exception as e:
@@ -292,20 +280,16 @@ def test_objects(repo_path=None):
 
 def test_async(repo_path=None):
     """Test async repository functions if available."""
-    print_separator('=')
-    print("TESTING ASYNC API")
-    print_separator('=')
+    print_header("TESTING ASYNC API")
 
     import gitoxide
-    import asyncio
 
     if not hasattr(gitoxide, 'asyncio'):
         print("Async API not available. Make sure to build with --features async")
         return False
 
     if repo_path is None:
-        repo_path = os.path.abspath(os.path.dirname(
-            os.path.dirname(os.path.dirname(__file__))))
+        repo_path = DEFAULT_REPO_PATH
 
     async def test_async_repo():
         # Try to use the async API
@@ -355,9 +339,7 @@ def test_async(repo_path=None):
 
 def create_test_repo():
     """Create a temporary test repository."""
-    print_separator('=')
-    print("CREATING TEST REPOSITORY")
-    print_separator('=')
+    print_header("CREATING TEST REPOSITORY")
 
     import gitoxide
 
@@ -370,33 +352,29 @@ def create_test_repo():
         print(f"Initialized repository at: {temp_dir}")
         print(f"Git directory: {repo.git_dir()}")
 
-        # Configure Git
-        subprocess.run(["git", "config", "--global",
-                       "user.email", "test@example.com"], check=True)
-        subprocess.run(["git", "config", "--global",
-                       "user.name", "Test User"], check=True)
-        print("Configured Git user")
-
         # Add a file and commit it
-        readme_path = os.path.join(temp_dir, "README.md")
-        with open(readme_path, "w") as f:
-            f.write("# Test Repository\n\nThis is a test repository.")
+        readme = b"# Test Repository\n\nThis is a test repository."
+        fd = os.open(os.path.join(temp_dir, "README.md"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, readme)
+        finally:
+            os.close(fd)
         print("Created README.md file")
 
-        subprocess.run(["git", "add", "README.md"], cwd=temp_dir, check=True)
-        print("Added README.md to index")
-
-        subprocess.run(["git", "commit", "-m", "Initial commit"],
-                       cwd=temp_dir, check=True)
-        print("Created initial commit")
+        blob_id = repo.write_blob(readme)
+        tree_id = repo.write_tree([("README.md", blob_id)])
+        commit_id = repo.commit("HEAD", "Initial commit", tree_id, [],
+                                author_name="Test User",
+                                author_email="test@example.com")
+        print(f"Created initial commit: {commit_id}")
 
-        # Create a branch
-        subprocess.run(["git", "checkout", "-b", "test-branch"],
-                       cwd=temp_dir, check=True)
+        # Create a branch and make it the current one
+        repo.create_reference("refs/heads/test-branch", commit_id, False, True)
+        repo.create_reference("HEAD", "refs/heads/test-branch", True, True)
         print("Created test-branch")
 
         # Add a tag
-        subprocess.run(["git", "tag", "v1.0"], cwd=temp_dir, check=True)
+        repo.create_reference("refs/tags/v1.0", commit_id, False, True)
         print("Created tag v1.0")
 
         return temp_dir
@@ -418,6 +396,8 @@ def parse_args():
                         help="Test error types")
     parser.add_argument("--test-repo", action="store_true",
                         help="Test repository info")
+    parser.add_argument("--open-mode", choices=["discover", "bare"], default="discover",
+                        help="How the repository info test opens the repository")
     parser.add_argument("--test-refs", action="store_true",
                         help="Test references")
     parser.add_argument(
@@ -432,8 +412,6 @@ def parse_args():
 
 def main():
     """Main function."""
-    import shutil
-
     args = parse_args()
 
     # If no specific tests are selected, run all tests
@@ -462,7 +440,8 @@ def main():
             results["errors"] = test_error_types()
 
         if args.test_repo or args.all:
-            results["repo"] = test_repository_info(args.repo or temp_repo)
+            results["repo"] = test_repository_info(
+                args.repo or temp_repo, args.open_mode)
 
         if args.test_refs or args.all:
             results["refs"] = test_references(args.repo or temp_repo)
@@ -474,9 +453,7 @@ def main():
             results["async"] = test_async(args.repo or temp_repo)
 
         # Print summary
-        print_separator('=')
-        print("TEST RESULTS SUMMARY")
-        print_separator('=')
+        print_header("TEST RESULTS SUMMARY")
 
         for test, result in results.items():
             status = "PASS" if result else "FAIL"
@@ -27,24 +27,41 @@ from gitoxide.gitoxide import (
     FSError
 )
 
-# Re-export main symbols
-__all__ = [
-    "Repository",
-    "__version__",
-    # Error types
+# The error types grouped in one importable submodule
+from gitoxide import errors
+
+# Re-export main symbols (kept sorted so it can be listed as-is)
+__all__ = (
+    "ConfigError",
+    "DiffError",
+    "FSError",
     "GitoxideError",
-    "RepositoryError",
+    "IndexError",
     "ObjectError",
+    "PackError",
+    "ProtocolError",
     "ReferenceError",
-    "ConfigError",
-    "IndexError",
-    "DiffError",
-    "TraverseError",
-    "WorktreeError",
-    "RevisionError",
     "RemoteError",
+    "Repository",
+    "RepositoryError",
+    "RevisionError",
     "TransportError",
-    "ProtocolError",
-    "PackError",
-    "FSError"
-]
+    "TraverseError",
+    "WorktreeError",
+    "__version__",
+    "errors",
+)
+
+
+def __getattr__(name):
+    # Load the async API on first access only, so sync-only users don't pay for it
+    if name == "asyncio":
+        import importlib
+
+        try:
+            module = importlib.import_module(f".{name}", __name__)
+        except ImportError as err:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from err
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,10 @@
+"""
+Asynchronous API of the gitoxide Python bindings.
+
+This module is only available when the native module was built with the
+``async`` feature; importing it raises ImportError otherwise.
+"""
+
+from gitoxide.gitoxide import AsyncRepository as Repository
+
+__all__ = ["Repository"]
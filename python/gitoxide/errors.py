@@ -0,0 +1,42 @@
+"""
+Exception types of the gitoxide Python bindings.
+
+All of them derive from GitoxideError. They are the same classes that are
+exported from the top-level ``gitoxide`` package.
+"""
+
+from gitoxide.gitoxide import (
+    GitoxideError,
+    RepositoryError,
+    ObjectError,
+    ReferenceError,
+    ConfigError,
+    IndexError,
+    DiffError,
+    TraverseError,
+    WorktreeError,
+    RevisionError,
+    RemoteError,
+    TransportError,
+    ProtocolError,
+    PackError,
+    FSError
+)
+
+__all__ = [
+    "GitoxideError",
+    "RepositoryError",
+    "ObjectError",
+    "ReferenceError",
+    "ConfigError",
+    "IndexError",
+    "DiffError",
+    "TraverseError",
+    "WorktreeError",
+    "RevisionError",
+    "RemoteError",
+    "TransportError",
+    "ProtocolError",
+    "PackError",
+    "FSError",
+]
@@ -7,20 +7,24 @@ This script installs the gitoxide stubs for mypy and other type checkers.
 
 import os
 import shutil
-import site
 import sys
+import sysconfig
 from pathlib import Path
 
+
+def _write_file(path, data):
+    """Write bytes to path without setting up a buffered file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def main():
     """Install gitoxide stubs to the site-packages directory."""
-    # Determine the site-packages directory
-    for site_dir in site.getsitepackages():
-        if site_dir.endswith('site-packages'):
-            dest_dir = Path(site_dir) / 'gitoxide-stubs'
-            break
-    else:
-        print("Could not find site-packages directory")
-        return 1
+    # Install next to pure-Python packages of the running interpreter (or venv)
+    dest_dir = Path(sysconfig.get_paths()['purelib']) / 'gitoxide-stubs'
 
     # Create destination directory if it doesn't exist
     if not dest_dir.exists():
@@ -33,27 +37,21 @@ def main():
         print(f"Stub source directory not found: {source_dir}")
         return 1
 
-    # Create package structure
-    os.makedirs(dest_dir / 'gitoxide', exist_ok=True)
-
-    # Copy stub files
-    for file in source_dir.glob('*.pyi'):
-        shutil.copy2(file, dest_dir / 'gitoxide')
-        print(f"Copied: {file.name}")
+    # Copy the stub files and py.typed in a single tree walk; plain copyfile
+    # is enough since the stubs' metadata doesn't need to be preserved
+    def copy_stub(src, dst):
+        shutil.copyfile(src, dst)
+        print(f"Copied: {os.path.basename(src)}")
 
-    # Copy py.typed file
-    py_typed = source_dir / 'py.typed'
-    if py_typed.exists():
-        shutil.copy2(py_typed, dest_dir / 'gitoxide')
-        print("Copied: py.typed")
+    def ignore_non_stubs(directory, names):
+        return [name for name in names if not (name.endswith('.pyi') or name == 'py.typed')]
 
-    # Create package-level __init__.py
-    with open(dest_dir / '__init__.py', 'w') as f:
-        f.write('# gitoxide type stubs\n')
+    shutil.copytree(source_dir, dest_dir / 'gitoxide', dirs_exist_ok=True,
+                    ignore=ignore_non_stubs, copy_function=copy_stub)
 
-    # Create package-level py.typed
-    with open(dest_dir / 'py.typed', 'w') as f:
-        pass
+    # Create package-level __init__.py and py.typed
+    _write_file(dest_dir / '__init__.py', b'# gitoxide type stubs\n')
+    _write_file(dest_dir / 'py.typed', b'')
 
     print(f"Successfully installed gitoxide stubs to {dest_dir}")
     return 0
@@ -1,3 +0,0 @@
-// This module is only available when the "async" feature is enabled
-#[cfg(feature = "async")]
-pub mod repository;
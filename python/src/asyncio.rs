@@ -1,8 +1,10 @@
+use pyo3::exceptions::PyStopAsyncIteration;
 use pyo3::prelude::*;
 use pyo3::types::{PyBytes, PyType};
 use std::path::Path;
+use std::sync::Arc;
 use gix_hash::ObjectId;
-use pyo3_async_runtimes::tokio::{self, future_into_py};
+use pyo3_async_runtimes::tokio::{self as pyo3_tokio, future_into_py};
 
 use crate::errors::repository_error;
 
@@ -34,6 +36,35 @@ struct GitReference {
     is_symbolic: bool,
 }
 
+/// Number of batches the shallow commit producer may run ahead of the consumer
+const SHALLOW_STREAM_CAPACITY: usize = 4;
+
+/// An async iterator over the shallow commits of a repository, in batches
+///
+/// The commits are produced on a blocking task and handed over through a
+/// bounded channel, so only a few batches are converted ahead of the consumer.
+#[pyclass(unsendable)]
+struct ShallowCommitStream {
+    rx: Arc<tokio::sync::Mutex<tokio::sync::mpsc::Receiver<PyResult<Vec<String>>>>>,
+}
+
+#[pymethods]
+impl ShallowCommitStream {
+    fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __anext__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let rx = self.rx.clone();
+        future_into_py(py, async move {
+            match rx.lock().await.recv().await {
+                Some(batch) => batch,
+                None => Err(PyStopAsyncIteration::new_err(())),
+            }
+        })
+    }
+}
+
 /// A Git repository with async operations
 #[pyclass(unsendable, name = "AsyncRepository")]
 pub struct Repository {
@@ -53,7 +84,7 @@ impl Repository {
         py: Python<'py>,
     ) -> PyResult<Bound<'py, PyAny>> {
         let path = Path::new(path).to_owned();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let result = gix::open(&path);
             match result {
                 Ok(repo) => Ok(Repository { inner: repo }),
@@ -80,7 +111,7 @@ impl Repository {
     ) -> PyResult<Bound<'py, PyAny>> {
         let path = Path::new(path).to_owned();
         let bare = bare.unwrap_or(false);
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             // Use the appropriate init method
             let result = if bare {
                 gix::init_bare(&path)
@@ -136,7 +167,7 @@ impl Repository {
     /// a shallow clone.
     fn shallow_commits<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             match repo.shallow_commits() {
                 Ok(Some(commits)) => {
                     let commit_strs = commits.iter().map(|id| id.to_string()).collect::<Vec<_>>();
@@ -151,6 +182,41 @@ impl Repository {
         })
     }
 
+    /// Stream the shallow commits in batches
+    ///
+    /// Use as `async for batch in repo.shallow_commits_stream(): ...`. Each
+    /// batch is a list of at most `batch_size` commit IDs; nothing is yielded
+    /// if the repository isn't a shallow clone.
+    #[pyo3(signature = (batch_size=256))]
+    fn shallow_commits_stream(&self, batch_size: usize) -> PyResult<ShallowCommitStream> {
+        if batch_size == 0 {
+            return Err(repository_error("batch_size must be at least 1".to_string()));
+        }
+        let repo = self.inner.clone();
+        let (tx, rx) = tokio::sync::mpsc::channel(SHALLOW_STREAM_CAPACITY);
+        pyo3_tokio::get_runtime().spawn_blocking(move || {
+            let commits = match repo.shallow_commits() {
+                Ok(Some(commits)) => commits,
+                Ok(None) => return,
+                Err(err) => {
+                    let msg = format!("Failed to get shallow commits: {}", err);
+                    let _ = tx.blocking_send(Err(repository_error(msg)));
+                    return;
+                }
+            };
+            for chunk in commits.chunks(batch_size) {
+                let batch = chunk.iter().map(|id| id.to_string()).collect();
+                // The consumer went away, stop producing
+                if tx.blocking_send(Ok(batch)).is_err() {
+                    break;
+                }
+            }
+        });
+        Ok(ShallowCommitStream {
+            rx: Arc::new(tokio::sync::Mutex::new(rx)),
+        })
+    }
+
     /// Get the hash algorithm used for Git objects in this repository
     fn object_hash(&self) -> String {
         format!("{:?}", self.inner.object_hash())
@@ -166,7 +232,7 @@ impl Repository {
     fn find_object<'py>(&self, id: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let id = id.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let object_id = ObjectId::from_hex(id.as_bytes())
                 .map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
 
@@ -197,7 +263,7 @@ impl Repository {
     fn find_blob<'py>(&self, id: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let id = id.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let object_id = ObjectId::from_hex(id.as_bytes())
                 .map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
 
@@ -228,7 +294,7 @@ impl Repository {
     fn find_commit<'py>(&self, id: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let id = id.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let object_id = ObjectId::from_hex(id.as_bytes())
                 .map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
 
@@ -259,7 +325,7 @@ impl Repository {
     fn find_tree<'py>(&self, id: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let id = id.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let object_id = ObjectId::from_hex(id.as_bytes())
                 .map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
 
@@ -290,7 +356,7 @@ impl Repository {
     fn find_tag<'py>(&self, id: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let id = id.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let object_id = ObjectId::from_hex(id.as_bytes())
                 .map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
 
@@ -321,7 +387,7 @@ impl Repository {
     fn find_header<'py>(&self, id: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let id = id.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let object_id = ObjectId::from_hex(id.as_bytes())
                 .map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
 
@@ -351,7 +417,7 @@ impl Repository {
     fn has_object<'py>(&self, id: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let id = id.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let object_id = ObjectId::from_hex(id.as_bytes())
                 .map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
 
@@ -364,7 +430,7 @@ impl Repository {
     /// Returns a list of all references (branches, tags, etc.)
     fn references<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let references = match repo.references() {
                 Ok(refs) => refs,
                 Err(err) => {
@@ -408,10 +474,60 @@ impl Repository {
         })
     }
 
+    /// Get all references in the repository as parallel lists asynchronously
+    ///
+    /// Returns:
+    ///     A tuple of three lists of equal length: reference names, targets,
+    ///     and flags telling whether each reference is symbolic
+    fn references_columns<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let repo = self.inner.clone();
+        blocking_into_py(py, move || {
+            let references = match repo.references() {
+                Ok(refs) => refs,
+                Err(err) => {
+                    let msg = format!("Failed to get references: {}", err);
+                    return Err(repository_error(msg));
+                }
+            };
+
+            let refs_iter = match references.all() {
+                Ok(iter) => iter,
+                Err(err) => {
+                    let msg = format!("Failed to get all references: {}", err);
+                    return Err(repository_error(msg));
+                }
+            };
+
+            let mut names = Vec::new();
+            let mut targets = Vec::new();
+            let mut symbolic = Vec::new();
+            for ref_result in refs_iter {
+                match ref_result {
+                    Ok(r) => {
+                        let (target, is_symbolic) = match r.inner.target {
+                            gix_ref::Target::Symbolic(name) => (name.as_bstr().to_string(), true),
+                            gix_ref::Target::Object(id) => (id.to_string(), false),
+                        };
+
+                        names.push(r.inner.name.as_bstr().to_string());
+                        targets.push(target);
+                        symbolic.push(is_symbolic);
+                    }
+                    Err(err) => {
+                        let msg = format!("Error with reference: {}", err);
+                        return Err(repository_error(msg));
+                    }
+                }
+            }
+
+            Ok((names, targets, symbolic))
+        })
+    }
+
     /// Get a list of all reference names in the repository asynchronously
     fn reference_names<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let references = match repo.references() {
                 Ok(refs) => refs,
                 Err(err) => {
@@ -455,7 +571,7 @@ impl Repository {
     fn find_reference<'py>(&self, name: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let name = name.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let r = repo.find_reference(&name)
                 .map_err(|err| {
                     let msg = format!("Failed to find reference '{}': {}", name, err);
@@ -489,7 +605,7 @@ impl Repository {
         let name = name.to_string();
         let target = target.to_string();
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             let constraint = if force {
                 gix_ref::transaction::PreviousValue::Any
             } else {
@@ -587,7 +703,7 @@ impl Repository {
     /// or the commit ID if HEAD is detached
     fn head<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
         let repo = self.inner.clone();
-        future_into_py(py, async move {
+        blocking_into_py(py, move || {
             repo.head_ref()
                 .map_err(|err| {
                     let msg = format!("Failed to get HEAD: {}", err);
@@ -599,6 +715,43 @@ impl Repository {
                 })
         })
     }
+
+    /// Parse a revision specification and return a single commit/object ID asynchronously
+    ///
+    /// Args:
+    ///     spec: The revision specification (e.g., "HEAD", "main~3", "v1.0^{}")
+    ///
+    /// Returns:
+    ///     The object ID that the revision specification resolves to
+    fn rev_parse<'py>(&self, spec: &str, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let spec = spec.to_string();
+        let repo = self.inner.clone();
+        blocking_into_py(py, move || {
+            repo.rev_parse_single(spec.as_str())
+                .map_err(|err| repository_error(format!("Failed to parse revision '{}': {}", spec, err)))
+                .map(|id| id.to_string())
+        })
+    }
+}
+
+/// Run blocking gitoxide work on tokio's blocking thread pool and return an awaitable for its result
+///
+/// gix performs synchronous file system and pack access, so running it directly
+/// inside the future would stall a runtime worker thread. The blocking pool threads
+/// don't hold the GIL, and the awaiting Python event loop is only notified once
+/// the result is ready. Every call is scheduled on the one runtime that
+/// `pyo3_async_runtimes::tokio` creates lazily for the whole process, so no
+/// repository or call builds a runtime of its own.
+fn blocking_into_py<'py, F, T>(py: Python<'py>, f: F) -> PyResult<Bound<'py, PyAny>>
+where
+    F: FnOnce() -> PyResult<T> + Send + 'static,
+    T: for<'a> IntoPyObject<'a> + Send + 'static,
+{
+    future_into_py(py, async move {
+        tokio::task::spawn_blocking(f)
+            .await
+            .map_err(|err| repository_error(format!("Background task failed: {}", err)))?
+    })
 }
 
 #[allow(dead_code)]
@@ -7,7 +7,16 @@ mod errors;
 mod repository;
 
 /// Python bindings for gitoxide - a fast, safe Git implementation in Rust
-#[pymodule]
+///
+/// The module declares that it doesn't need the GIL, which keeps free-threaded
+/// Python builds from re-enabling it on import. All classes are unsendable, so
+/// each instance is only ever used by the thread that created it. The shared
+/// state that remains is synchronized without the GIL: the async API runs on
+/// the global tokio runtime of pyo3-async-runtimes, which is initialized once
+/// and is `Send + Sync`, and a `ShallowCommitStream` hands its channel to the
+/// futures it creates through an `Arc<tokio::sync::Mutex<_>>`, so only one of
+/// them receives from it at a time.
+#[pymodule(gil_used = false)]
 fn gitoxide(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
 
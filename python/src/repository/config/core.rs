@@ -1,5 +1,8 @@
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
+use std::collections::BTreeSet;
+
+use crate::errors::config_error;
 
 /// A Git configuration object
 ///
@@ -116,6 +119,33 @@ impl Config {
         result
     }
 
+    /// Get the subsection names of all sections with the given name
+    ///
+    /// Args:
+    ///     section: The section name (e.g., "remote")
+    ///
+    /// Returns:
+    ///     A list of unique subsection names in the order they appear,
+    ///     e.g. the names of all configured remotes
+    fn section_subsections(&self, section: &str) -> Vec<String> {
+        let config = self.repo.config_snapshot();
+        let mut seen = BTreeSet::new();
+        let mut names: Vec<String> = Vec::new();
+
+        if let Some(sections) = config.plumbing().sections_by_name(section) {
+            for section in sections {
+                if let Some(name) = section.header().subsection_name() {
+                    // Keep the first occurrence of each name, in order
+                    if seen.insert(name) {
+                        names.push(name.to_string());
+                    }
+                }
+            }
+        }
+
+        names
+    }
+
     /// List configuration entries for common sections
     ///
     /// Returns:
@@ -184,6 +214,24 @@ impl Config {
         dict.into()
     }
 
+    /// Re-read the configuration from disk
+    ///
+    /// The configuration is loaded when the repository is opened. Call this to
+    /// pick up changes made since, e.g. by `git config`. Only the configuration
+    /// is re-read: the global, repository, worktree and environment sources,
+    /// with includes followed. The Repository the Config came from keeps the
+    /// values it was opened with.
+    fn reload(&mut self) -> PyResult<()> {
+        let file = gix::config::File::from_git_dir(self.repo.common_dir().to_owned())
+            .map_err(|err| config_error(format!("Failed to reload configuration: {}", err)))?;
+        let mut snapshot = self.repo.config_snapshot_mut();
+        *snapshot = file;
+        snapshot
+            .commit()
+            .map_err(|err| config_error(format!("Failed to reload configuration: {}", err)))?;
+        Ok(())
+    }
+
     /// Check if a configuration key exists
     ///
     /// Args:
@@ -3,17 +3,32 @@ use pyo3::types::{PyBytes, PyType};
 use std::path::Path;
 
 use crate::errors::repository_error;
+use crate::repository::objects::ObjectIdArg;
 
 #[pyclass(unsendable)]
 pub struct GitObject {
-    #[pyo3(get)]
-    pub id: String,
+    pub oid: gix_hash::ObjectId,
     #[pyo3(get)]
     pub kind: String,
     #[pyo3(get)]
     pub data: Py<PyBytes>,
 }
 
+#[pymethods]
+impl GitObject {
+    /// The object ID as a hex string, formatted on access
+    #[getter]
+    fn id(&self) -> String {
+        self.oid.to_string()
+    }
+
+    /// The object ID as raw bytes, e.g. 20 bytes for SHA-1
+    #[getter]
+    fn raw_id<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, self.oid.as_bytes())
+    }
+}
+
 #[pyclass(unsendable)]
 pub struct ObjectHeader {
     #[pyo3(get)]
@@ -32,6 +47,27 @@ pub struct GitReference {
     pub is_symbolic: bool,
 }
 
+/// An iterator over the references of a repository
+///
+/// The reference names are listed when the iterator is created, and each
+/// reference is read only once the iterator reaches it.
+#[pyclass(unsendable)]
+pub struct ReferenceIter {
+    pub(crate) repo: gix::Repository,
+    pub(crate) names: std::vec::IntoIter<gix_ref::FullName>,
+}
+
+#[pymethods]
+impl ReferenceIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<GitReference>> {
+        crate::repository::references::next_reference(&mut slf)
+    }
+}
+
 /// A Git repository
 #[pyclass(unsendable)]
 pub struct Repository {
@@ -44,10 +80,34 @@ impl Repository {
     ///
     /// The path can be the repository's `.git` directory, or the working directory.
     #[classmethod]
-    fn open(_cls: &Bound<'_, PyType>, path: &str) -> PyResult<Self> {
+    fn open(cls: &Bound<'_, PyType>, path: &str) -> PyResult<Self> {
+        let path = Path::new(path);
+
+        // Discovery and reading the configuration only touch the file system,
+        // so other Python threads may run meanwhile
+        cls.py()
+            .allow_threads(|| gix::open(path))
+            .map_err(|err| {
+                let msg = format!("Failed to open repository at {}: {}", path.display(), err);
+                repository_error(msg)
+            })
+            .map(|repo| Repository { inner: repo })
+    }
+
+    /// Open the repository whose git directory is exactly the given path
+    ///
+    /// Unlike open(), the path is used as-is without probing for a `.git` directory
+    /// within it, and only the repository's own configuration is loaded, skipping
+    /// system, global and user configuration as well as asking the git binary for
+    /// its installation configuration. This makes it a cheaper way to open
+    /// repositories whose layout is known, like bare repositories or the git
+    /// directory of a repository that was just created.
+    #[classmethod]
+    fn open_bare(_cls: &Bound<'_, PyType>, path: &str) -> PyResult<Self> {
         let path = Path::new(path);
+        let options = gix::open::Options::isolated().open_path_as_is(true);
 
-        gix::open(path)
+        gix::open_opts(path, options)
             .map_err(|err| {
                 let msg = format!("Failed to open repository at {}: {}", path.display(), err);
                 repository_error(msg)
@@ -90,6 +150,19 @@ impl Repository {
         self.inner.is_bare()
     }
 
+    /// Get the path to the repository's .git directory as bytes
+    ///
+    /// The bytes are the path as stored by the operating system, like `os.fsencode()`
+    /// would produce, which avoids decoding paths that are only passed on to `os` functions.
+    fn git_dir_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &gix::path::into_bstr(self.inner.git_dir()))
+    }
+
+    /// Get the path to the repository's working directory as bytes, if it has one
+    fn work_dir_bytes<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyBytes>> {
+        self.inner.workdir().map(|p| PyBytes::new(py, &gix::path::into_bstr(p)))
+    }
+
     /// Check if the repository is a shallow clone
     ///
     /// A shallow repository contains history only up to a certain depth.
@@ -135,78 +208,149 @@ impl Repository {
     /// Find a Git object by its ID
     ///
     /// Args:
-    ///     id: The object ID (SHA) as a string
+    ///     id: The object ID (SHA) as a hex string or as raw bytes
     ///
     /// Returns:
     ///     A GitObject containing the object's ID, kind, and data
-    fn find_object(&self, id: &str) -> PyResult<GitObject> {
-        crate::repository::objects::find_object(self, id)
+    fn find_object(&self, py: Python<'_>, id: ObjectIdArg) -> PyResult<GitObject> {
+        crate::repository::objects::find_object(self, py, &id)
     }
 
     /// Find a blob object by its ID
     ///
     /// Args:
-    ///     id: The object ID (SHA) as a string
+    ///     id: The object ID (SHA) as a hex string or as raw bytes
     ///
     /// Returns:
     ///     A GitObject with kind="Blob"
-    fn find_blob(&self, id: &str) -> PyResult<GitObject> {
-        crate::repository::objects::find_blob(self, id)
+    fn find_blob(&self, py: Python<'_>, id: ObjectIdArg) -> PyResult<GitObject> {
+        crate::repository::objects::find_blob(self, py, &id)
     }
 
     /// Find a commit object by its ID
     ///
     /// Args:
-    ///     id: The object ID (SHA) as a string
+    ///     id: The object ID (SHA) as a hex string or as raw bytes
     ///
     /// Returns:
     ///     A GitObject with kind="Commit"
-    fn find_commit(&self, id: &str) -> PyResult<GitObject> {
-        crate::repository::objects::find_commit(self, id)
+    fn find_commit(&self, py: Python<'_>, id: ObjectIdArg) -> PyResult<GitObject> {
+        crate::repository::objects::find_commit(self, py, &id)
     }
 
     /// Find a tree object by its ID
     ///
     /// Args:
-    ///     id: The object ID (SHA) as a string
+    ///     id: The object ID (SHA) as a hex string or as raw bytes
     ///
     /// Returns:
     ///     A GitObject with kind="Tree"
-    fn find_tree(&self, id: &str) -> PyResult<GitObject> {
-        crate::repository::objects::find_tree(self, id)
+    fn find_tree(&self, py: Python<'_>, id: ObjectIdArg) -> PyResult<GitObject> {
+        crate::repository::objects::find_tree(self, py, &id)
     }
 
     /// Find a tag object by its ID
     ///
     /// Args:
-    ///     id: The object ID (SHA) as a string
+    ///     id: The object ID (SHA) as a hex string or as raw bytes
     ///
     /// Returns:
     ///     A GitObject with kind="Tag"
-    fn find_tag(&self, id: &str) -> PyResult<GitObject> {
-        crate::repository::objects::find_tag(self, id)
+    fn find_tag(&self, py: Python<'_>, id: ObjectIdArg) -> PyResult<GitObject> {
+        crate::repository::objects::find_tag(self, py, &id)
     }
 
     /// Get information about an object without fully decoding it
     ///
     /// Args:
-    ///     id: The object ID (SHA) as a string
+    ///     id: The object ID (SHA) as a hex string or as raw bytes
     ///
     /// Returns:
     ///     An ObjectHeader containing the object's kind and size
-    fn find_header(&self, id: &str) -> PyResult<ObjectHeader> {
-        crate::repository::objects::find_header(self, id)
+    fn find_header(&self, id: ObjectIdArg) -> PyResult<ObjectHeader> {
+        crate::repository::objects::find_header(self, &id)
     }
 
     /// Check if an object exists in the repository
     ///
     /// Args:
-    ///     id: The object ID (SHA) as a string
+    ///     id: The object ID (SHA) as a hex string or as raw bytes
     ///
     /// Returns:
     ///     True if the object exists, False otherwise
-    fn has_object(&self, id: &str) -> PyResult<bool> {
-        crate::repository::objects::has_object(self, id)
+    fn has_object(&self, id: ObjectIdArg) -> PyResult<bool> {
+        crate::repository::objects::has_object(self, &id)
+    }
+
+    /// Check which of the given objects exist in the repository
+    ///
+    /// Args:
+    ///     ids: A list of object IDs (SHAs) as hex strings or as raw bytes
+    ///
+    /// Returns:
+    ///     A list of booleans, True for each object that exists
+    fn has_objects(&self, py: Python<'_>, ids: Vec<ObjectIdArg>) -> PyResult<Vec<bool>> {
+        crate::repository::objects::has_objects(self, py, ids)
+    }
+
+    /// Get information about several objects without fully decoding them
+    ///
+    /// Args:
+    ///     ids: A list of object IDs (SHAs) as hex strings or as raw bytes
+    ///
+    /// Returns:
+    ///     A list of ObjectHeaders, in the same order as the IDs
+    fn find_headers(&self, py: Python<'_>, ids: Vec<ObjectIdArg>) -> PyResult<Vec<ObjectHeader>> {
+        crate::repository::objects::find_headers(self, py, ids)
+    }
+
+    /// Write a blob to the object database
+    ///
+    /// Args:
+    ///     data: The content of the blob as bytes
+    ///
+    /// Returns:
+    ///     The ID of the written blob
+    fn write_blob(&self, data: &[u8]) -> PyResult<String> {
+        crate::repository::objects::write_blob(self, data)
+    }
+
+    /// Write a tree to the object database
+    ///
+    /// Args:
+    ///     entries: A list of (filename, object ID) pairs, with each ID as a hex
+    ///         string or as raw bytes; the entry mode is derived from the kind
+    ///         of the referenced object
+    ///
+    /// Returns:
+    ///     The ID of the written tree
+    fn write_tree(&self, entries: Vec<(String, ObjectIdArg)>) -> PyResult<String> {
+        crate::repository::objects::write_tree(self, entries)
+    }
+
+    /// Create a new commit and update a reference to point to it
+    ///
+    /// Args:
+    ///     reference: The reference to update (e.g., "HEAD" or "refs/heads/main")
+    ///     message: The commit message
+    ///     tree: The ID of the tree to commit, as a hex string or as raw bytes
+    ///     parents: A list of parent commit IDs, as hex strings or raw bytes
+    ///     author_name: The name to use as author and committer, or None to use the configured identity
+    ///     author_email: The email to use as author and committer, or None to use the configured identity
+    ///
+    /// Returns:
+    ///     The ID of the new commit
+    #[pyo3(signature = (reference, message, tree, parents, author_name=None, author_email=None))]
+    fn commit(
+        &self,
+        reference: &str,
+        message: &str,
+        tree: ObjectIdArg,
+        parents: Vec<ObjectIdArg>,
+        author_name: Option<&str>,
+        author_email: Option<&str>,
+    ) -> PyResult<String> {
+        crate::repository::objects::commit(self, reference, message, &tree, &parents, author_name, author_email)
     }
 
     // Reference-related methods
@@ -214,13 +358,41 @@ impl Repository {
     /// Get all references in the repository
     ///
     /// Returns a list of all references (branches, tags, etc.)
-    fn references(&self) -> PyResult<Vec<GitReference>> {
-        crate::repository::references::references(self)
+    fn references(&self, py: Python<'_>) -> PyResult<Vec<GitReference>> {
+        crate::repository::references::references(self, py)
+    }
+
+    /// Get an iterator over all references in the repository
+    ///
+    /// Unlike references(), only the names are listed up front; each reference
+    /// is read from disk as the iterator reaches it and is never collected into
+    /// a list, which is cheaper when only a few are needed. References deleted
+    /// in the meantime are skipped, and errors while reading them are raised by
+    /// the iterator.
+    fn iter_references(&self, py: Python<'_>) -> PyResult<ReferenceIter> {
+        crate::repository::references::iter_references(self, py)
+    }
+
+    /// Count the references in the repository
+    ///
+    /// The names in packed-refs and of the loose reference files are counted
+    /// without reading the references themselves.
+    fn reference_count(&self, py: Python<'_>) -> PyResult<usize> {
+        crate::repository::references::reference_count(self, py)
+    }
+
+    /// Get all references in the repository as parallel lists
+    ///
+    /// Returns:
+    ///     A tuple of three lists of equal length: reference names, targets,
+    ///     and flags telling whether each reference is symbolic
+    fn references_columns(&self, py: Python<'_>) -> PyResult<(Vec<String>, Vec<String>, Vec<bool>)> {
+        crate::repository::references::references_columns(self, py)
     }
 
     /// Get a list of all reference names in the repository
-    fn reference_names(&self) -> PyResult<Vec<String>> {
-        crate::repository::references::reference_names(self)
+    fn reference_names(&self, py: Python<'_>) -> PyResult<Vec<String>> {
+        crate::repository::references::reference_names(self, py)
     }
 
     /// Find a reference by name
@@ -259,7 +431,7 @@ impl Repository {
     /// Find all merge bases between one commit and multiple other commits
     ///
     /// Args:
-    ///     one: First commit ID as a string
+    ///     one: First commit ID as a hex string or as raw bytes
     ///     others: List of other commit IDs to find merge bases with
     ///
     /// Returns:
@@ -267,23 +439,65 @@ impl Repository {
     ///
     /// Raises:
     ///     RepositoryError: If one of the commit IDs is invalid
-    fn merge_bases(&self, one: &str, others: Vec<String>) -> PyResult<Vec<String>> {
-        crate::repository::revisions::merge_bases(self, one, others)
+    fn merge_bases(&self, one: ObjectIdArg, others: Vec<ObjectIdArg>) -> PyResult<Vec<String>> {
+        let bases = crate::repository::revisions::merge_bases(self, &one, &others)?;
+        Ok(bases.iter().map(|id| id.to_string()).collect())
+    }
+
+    /// Find all merge bases between one commit and multiple other commits as raw IDs
+    ///
+    /// Like `merge_bases()`, but the merge bases are returned as raw bytes, which
+    /// skips formatting each ID as hex when it is only passed back to other calls.
+    ///
+    /// Args:
+    ///     one: First commit ID as a hex string or as raw bytes
+    ///     others: List of other commit IDs to find merge bases with
+    ///
+    /// Returns:
+    ///     List of commit IDs that are merge bases, as raw bytes
+    ///
+    /// Raises:
+    ///     RepositoryError: If one of the commit IDs is invalid
+    fn merge_bases_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        one: ObjectIdArg,
+        others: Vec<ObjectIdArg>,
+    ) -> PyResult<Vec<Bound<'py, PyBytes>>> {
+        let bases = crate::repository::revisions::merge_bases(self, &one, &others)?;
+        Ok(bases.iter().map(|id| PyBytes::new(py, id.as_bytes())).collect())
     }
 
     /// Find the best merge base between two commits
     ///
     /// Args:
-    ///     one: First commit ID as a string
-    ///     two: Second commit ID as a string
+    ///     one: First commit ID as a hex string or as raw bytes
+    ///     two: Second commit ID as a hex string or as raw bytes
     ///
     /// Returns:
     ///     The commit ID of the merge base
     ///
     /// Raises:
     ///     RepositoryError: If a commit ID is invalid or no merge base exists
-    fn merge_base(&self, one: &str, two: &str) -> PyResult<String> {
-        crate::repository::revisions::merge_base(self, one, two)
+    fn merge_base(&self, one: ObjectIdArg, two: ObjectIdArg) -> PyResult<String> {
+        crate::repository::revisions::merge_base(self, &one, &two)
+    }
+
+    /// Find the best merge base for each of several pairs of commits
+    ///
+    /// The pairs are answered with one shared commit graph, which is much faster
+    /// than calling `merge_base()` once per pair when histories overlap.
+    ///
+    /// Args:
+    ///     pairs: A list of (one, two) commit ID pairs, as hex strings or raw bytes
+    ///
+    /// Returns:
+    ///     The commit ID of the merge base of each pair, in the same order
+    ///
+    /// Raises:
+    ///     RepositoryError: If a commit ID is invalid or a pair has no merge base
+    fn merge_base_pairs(&self, py: Python<'_>, pairs: Vec<(ObjectIdArg, ObjectIdArg)>) -> PyResult<Vec<String>> {
+        crate::repository::revisions::merge_base_pairs(self, py, pairs)
     }
 
     /// Parse a revision specification and return a single commit/object ID
@@ -5,125 +5,108 @@ use pyo3::types::PyBytes;
 use crate::errors::repository_error;
 use crate::repository::core::{GitObject, ObjectHeader, Repository};
 
-/// Find a Git object by its ID
-pub(crate) fn find_object(repo: &Repository, id: &str) -> PyResult<GitObject> {
-    let object_id =
-        ObjectId::from_hex(id.as_bytes()).map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
+/// An object ID passed in from Python, either as a hex string or as raw bytes
+#[derive(FromPyObject)]
+pub(crate) enum ObjectIdArg {
+    Hex(String),
+    Raw(Vec<u8>),
+}
 
-    repo.inner
-        .find_object(object_id)
-        .map_err(|err| {
+impl ObjectIdArg {
+    /// Convert the argument into an object ID
+    pub(crate) fn to_object_id(&self) -> PyResult<ObjectId> {
+        let object_id = match self {
+            ObjectIdArg::Hex(hex) => ObjectId::from_hex(hex.as_bytes()).ok(),
+            ObjectIdArg::Raw(raw) => ObjectId::try_from(raw.as_slice()).ok(),
+        };
+        object_id.ok_or_else(|| repository_error(format!("Invalid object ID: {}", self)))
+    }
+}
+
+impl std::fmt::Display for ObjectIdArg {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        match self {
+            ObjectIdArg::Hex(hex) => f.write_str(hex),
+            ObjectIdArg::Raw(raw) => raw.iter().try_for_each(|byte| write!(f, "{:02x}", byte)),
+        }
+    }
+}
+
+/// Look up a single object and copy its data to Python
+///
+/// A single lookup is usually done in microseconds, which is less than
+/// cloning the repository handle to release the GIL would cost, so it runs
+/// with the GIL held. The batch lookups below release it instead.
+fn find_detached<F>(repo: &Repository, py: Python<'_>, id: &ObjectIdArg, find: F) -> PyResult<GitObject>
+where
+    F: FnOnce(&gix::Repository, ObjectId) -> PyResult<gix::ObjectDetached>,
+{
+    let object_id = id.to_object_id()?;
+
+    let obj = find(&repo.inner, object_id)?;
+
+    Ok(GitObject {
+        oid: obj.id,
+        kind: format!("{:?}", obj.kind),
+        data: PyBytes::new(py, &obj.data).into(),
+    })
+}
+
+/// Find a Git object by its ID
+pub(crate) fn find_object(repo: &Repository, py: Python<'_>, id: &ObjectIdArg) -> PyResult<GitObject> {
+    find_detached(repo, py, id, |repo, object_id| {
+        repo.find_object(object_id).map(|obj| obj.detach()).map_err(|err| {
             let msg = format!("Failed to find object {}: {}", id, err);
             repository_error(msg)
         })
-        .and_then(|obj| {
-            Python::with_gil(|py| {
-                let bytes = PyBytes::new(py, &obj.data);
-                Ok(GitObject {
-                    id: obj.id.to_string(),
-                    kind: format!("{:?}", obj.kind),
-                    data: bytes.into(),
-                })
-            })
-        })
+    })
 }
 
 /// Find a blob object by its ID
-pub(crate) fn find_blob(repo: &Repository, id: &str) -> PyResult<GitObject> {
-    let object_id =
-        ObjectId::from_hex(id.as_bytes()).map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
-
-    repo.inner
-        .find_blob(object_id)
-        .map_err(|err| {
+pub(crate) fn find_blob(repo: &Repository, py: Python<'_>, id: &ObjectIdArg) -> PyResult<GitObject> {
+    find_detached(repo, py, id, |repo, object_id| {
+        repo.find_blob(object_id).map(|blob| blob.detach()).map_err(|err| {
             let msg = format!("Failed to find blob {}: {}", id, err);
             repository_error(msg)
         })
-        .and_then(|blob| {
-            Python::with_gil(|py| {
-                let bytes = PyBytes::new(py, &blob.data);
-                Ok(GitObject {
-                    id: blob.id.to_string(),
-                    kind: "Blob".to_string(),
-                    data: bytes.into(),
-                })
-            })
-        })
+    })
 }
 
 /// Find a commit object by its ID
-pub(crate) fn find_commit(repo: &Repository, id: &str) -> PyResult<GitObject> {
-    let object_id =
-        ObjectId::from_hex(id.as_bytes()).map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
-
-    repo.inner
-        .find_commit(object_id)
-        .map_err(|err| {
-            let msg = format!("Failed to find commit {}: {}", id, err);
-            repository_error(msg)
-        })
-        .and_then(|commit| {
-            Python::with_gil(|py| {
-                let bytes = PyBytes::new(py, &commit.data);
-                Ok(GitObject {
-                    id: commit.id.to_string(),
-                    kind: "Commit".to_string(),
-                    data: bytes.into(),
-                })
+pub(crate) fn find_commit(repo: &Repository, py: Python<'_>, id: &ObjectIdArg) -> PyResult<GitObject> {
+    find_detached(repo, py, id, |repo, object_id| {
+        repo.find_commit(object_id)
+            .map(|commit| commit.detach())
+            .map_err(|err| {
+                let msg = format!("Failed to find commit {}: {}", id, err);
+                repository_error(msg)
             })
-        })
+    })
 }
 
 /// Find a tree object by its ID
-pub(crate) fn find_tree(repo: &Repository, id: &str) -> PyResult<GitObject> {
-    let object_id =
-        ObjectId::from_hex(id.as_bytes()).map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
-
-    repo.inner
-        .find_tree(object_id)
-        .map_err(|err| {
+pub(crate) fn find_tree(repo: &Repository, py: Python<'_>, id: &ObjectIdArg) -> PyResult<GitObject> {
+    find_detached(repo, py, id, |repo, object_id| {
+        repo.find_tree(object_id).map(|tree| tree.detach()).map_err(|err| {
             let msg = format!("Failed to find tree {}: {}", id, err);
             repository_error(msg)
         })
-        .and_then(|tree| {
-            Python::with_gil(|py| {
-                let bytes = PyBytes::new(py, &tree.data);
-                Ok(GitObject {
-                    id: tree.id.to_string(),
-                    kind: "Tree".to_string(),
-                    data: bytes.into(),
-                })
-            })
-        })
+    })
 }
 
 /// Find a tag object by its ID
-pub(crate) fn find_tag(repo: &Repository, id: &str) -> PyResult<GitObject> {
-    let object_id =
-        ObjectId::from_hex(id.as_bytes()).map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
-
-    repo.inner
-        .find_tag(object_id)
-        .map_err(|err| {
+pub(crate) fn find_tag(repo: &Repository, py: Python<'_>, id: &ObjectIdArg) -> PyResult<GitObject> {
+    find_detached(repo, py, id, |repo, object_id| {
+        repo.find_tag(object_id).map(|tag| tag.detach()).map_err(|err| {
             let msg = format!("Failed to find tag {}: {}", id, err);
             repository_error(msg)
         })
-        .and_then(|tag| {
-            Python::with_gil(|py| {
-                let bytes = PyBytes::new(py, &tag.data);
-                Ok(GitObject {
-                    id: tag.id.to_string(),
-                    kind: "Tag".to_string(),
-                    data: bytes.into(),
-                })
-            })
-        })
+    })
 }
 
 /// Get information about an object without fully decoding it
-pub(crate) fn find_header(repo: &Repository, id: &str) -> PyResult<ObjectHeader> {
-    let object_id =
-        ObjectId::from_hex(id.as_bytes()).map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
+pub(crate) fn find_header(repo: &Repository, id: &ObjectIdArg) -> PyResult<ObjectHeader> {
+    let object_id = id.to_object_id()?;
 
     repo.inner
         .find_header(object_id)
@@ -143,9 +126,140 @@ pub(crate) fn find_header(repo: &Repository, id: &str) -> PyResult<ObjectHeader>
 }
 
 /// Check if an object exists in the repository
-pub(crate) fn has_object(repo: &Repository, id: &str) -> PyResult<bool> {
-    let object_id =
-        ObjectId::from_hex(id.as_bytes()).map_err(|_| repository_error(format!("Invalid object ID: {}", id)))?;
+pub(crate) fn has_object(repo: &Repository, id: &ObjectIdArg) -> PyResult<bool> {
+    let object_id = id.to_object_id()?;
 
     Ok(repo.inner.has_object(&object_id))
 }
+
+/// Parse a list of object IDs, failing on the first invalid one
+fn parse_object_ids(ids: &[ObjectIdArg]) -> PyResult<Vec<ObjectId>> {
+    ids.iter().map(ObjectIdArg::to_object_id).collect()
+}
+
+/// Check which of the given objects exist in the repository
+///
+/// All IDs are parsed up front and then looked up in one go with the GIL released,
+/// on one clone of the repository handle for the whole batch.
+pub(crate) fn has_objects(repo: &Repository, py: Python<'_>, ids: Vec<ObjectIdArg>) -> PyResult<Vec<bool>> {
+    let object_ids = parse_object_ids(&ids)?;
+
+    let inner = repo.inner.clone();
+    Ok(py.allow_threads(move || object_ids.iter().map(|oid| inner.has_object(oid)).collect()))
+}
+
+/// Get header information for each of the given objects
+///
+/// All IDs are parsed up front and then looked up in one go with the GIL released,
+/// on one clone of the repository handle for the whole batch.
+pub(crate) fn find_headers(repo: &Repository, py: Python<'_>, ids: Vec<ObjectIdArg>) -> PyResult<Vec<ObjectHeader>> {
+    let object_ids = parse_object_ids(&ids)?;
+
+    let inner = repo.inner.clone();
+    py.allow_threads(move || {
+        object_ids
+            .iter()
+            .map(|oid| {
+                inner
+                    .find_header(*oid)
+                    .map_err(|err| {
+                        let msg = format!("Failed to find header for {}: {}", oid, err);
+                        repository_error(msg)
+                    })
+                    .map(|header| ObjectHeader {
+                        kind: format!("{:?}", header.kind()),
+                        size: header.size(),
+                    })
+            })
+            .collect()
+    })
+}
+
+/// Write a blob with the given content to the object database
+pub(crate) fn write_blob(repo: &Repository, data: &[u8]) -> PyResult<String> {
+    repo.inner
+        .write_blob(data)
+        .map_err(|err| {
+            let msg = format!("Failed to write blob: {}", err);
+            repository_error(msg)
+        })
+        .map(|id| id.to_string())
+}
+
+/// Write a tree made of `(filename, id)` entries to the object database
+pub(crate) fn write_tree(repo: &Repository, entries: Vec<(String, ObjectIdArg)>) -> PyResult<String> {
+    let mut tree_entries = Vec::with_capacity(entries.len());
+    for (filename, id) in entries {
+        let object_id = id.to_object_id()?;
+
+        // Derive the entry mode from the kind of object it points to
+        let header = repo.inner.find_header(object_id).map_err(|err| {
+            let msg = format!("Failed to find header for {}: {}", id, err);
+            repository_error(msg)
+        })?;
+        let kind = match header.kind() {
+            gix::object::Kind::Tree => gix::objs::tree::EntryKind::Tree,
+            gix::object::Kind::Commit => gix::objs::tree::EntryKind::Commit,
+            _ => gix::objs::tree::EntryKind::Blob,
+        };
+
+        tree_entries.push(gix::objs::tree::Entry {
+            mode: kind.into(),
+            filename: filename.into(),
+            oid: object_id,
+        });
+    }
+
+    // Trees must be sorted the way Git sorts them
+    tree_entries.sort();
+
+    repo.inner
+        .write_object(gix::objs::Tree { entries: tree_entries })
+        .map_err(|err| {
+            let msg = format!("Failed to write tree: {}", err);
+            repository_error(msg)
+        })
+        .map(|id| id.to_string())
+}
+
+/// Create a commit and update `reference` to point to it
+pub(crate) fn commit(
+    repo: &Repository,
+    reference: &str,
+    message: &str,
+    tree: &ObjectIdArg,
+    parents: &[ObjectIdArg],
+    author_name: Option<&str>,
+    author_email: Option<&str>,
+) -> PyResult<String> {
+    let tree_id = tree.to_object_id()?;
+    let parent_ids = parse_object_ids(parents)?;
+
+    let result = match (author_name, author_email) {
+        (Some(name), Some(email)) => {
+            // Use the given identity as both author and committer
+            let signature = gix::actor::Signature {
+                name: name.into(),
+                email: email.into(),
+                time: gix::date::Time::now_local_or_utc(),
+            };
+            let mut time_buf = gix::date::parse::TimeBuf::default();
+            let signature = signature.to_ref(&mut time_buf);
+            repo.inner
+                .commit_as(signature, signature, reference, message, tree_id, parent_ids)
+        }
+        (None, None) => repo.inner.commit(reference, message, tree_id, parent_ids),
+        _ => {
+            return Err(repository_error(
+                "author_name and author_email must be provided together".to_string(),
+            ))
+        }
+    };
+
+    result
+        .map_err(|err| {
+            let msg = format!("Failed to create commit: {}", err);
+            repository_error(msg)
+        })
+        .map(|id| id.to_string())
+}
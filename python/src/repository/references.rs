@@ -1,56 +1,227 @@
+use gix::bstr::BString;
 use gix_hash::ObjectId;
 use pyo3::prelude::*;
+use std::collections::BTreeSet;
+use std::path::Path;
 
 use crate::errors::repository_error;
-use crate::repository::core::{GitReference, Repository};
+use crate::repository::core::{GitReference, ReferenceIter, Repository};
+
+/// Collect `(name, target, is_symbolic)` for every reference in the repository
+///
+/// Enumerating references walks the loose refs on disk and the packed-refs
+/// file, so it runs with the GIL released on a clone of the repository handle.
+fn collect_references(repo: &Repository, py: Python<'_>) -> PyResult<Vec<(String, String, bool)>> {
+    let inner = repo.inner.clone();
+    py.allow_threads(move || {
+        let platform = match inner.references() {
+            Ok(platform) => platform,
+            Err(err) => {
+                let msg = format!("Failed to get references: {}", err);
+                return Err(repository_error(msg));
+            }
+        };
+
+        let refs_iter = match platform.all() {
+            Ok(iter) => iter,
+            Err(err) => {
+                let msg = format!("Failed to get references: {}", err);
+                return Err(repository_error(msg));
+            }
+        };
+
+        let mut refs = Vec::new();
+        for result in refs_iter {
+            match result {
+                Ok(r) => {
+                    // Convert the target based on its type
+                    let (target, is_symbolic) = match r.inner.target {
+                        gix_ref::Target::Symbolic(name) => (name.as_bstr().to_string(), true),
+                        gix_ref::Target::Object(id) => (id.to_string(), false),
+                    };
+
+                    refs.push((r.inner.name.as_bstr().to_string(), target, is_symbolic));
+                }
+                Err(err) => {
+                    let msg = format!("Error with reference: {}", err);
+                    return Err(repository_error(msg));
+                }
+            }
+        }
+
+        Ok(refs)
+    })
+}
 
 /// Get all references in the repository
-pub(crate) fn references(repo: &Repository) -> PyResult<Vec<GitReference>> {
-    let platform = match repo.inner.references() {
-        Ok(platform) => platform,
-        Err(err) => {
-            let msg = format!("Failed to get references: {}", err);
-            return Err(repository_error(msg));
+pub(crate) fn references(repo: &Repository, py: Python<'_>) -> PyResult<Vec<GitReference>> {
+    let refs = collect_references(repo, py)?;
+
+    Ok(refs
+        .into_iter()
+        .map(|(name, target, is_symbolic)| GitReference {
+            name,
+            target,
+            is_symbolic,
+        })
+        .collect())
+}
+
+/// Get all references in the repository as parallel lists of names, targets and symbolic flags
+pub(crate) fn references_columns(repo: &Repository, py: Python<'_>) -> PyResult<(Vec<String>, Vec<String>, Vec<bool>)> {
+    let refs = collect_references(repo, py)?;
+
+    let mut names = Vec::with_capacity(refs.len());
+    let mut targets = Vec::with_capacity(refs.len());
+    let mut symbolic = Vec::with_capacity(refs.len());
+    for (name, target, is_symbolic) in refs {
+        names.push(name);
+        targets.push(target);
+        symbolic.push(is_symbolic);
+    }
+
+    Ok((names, targets, symbolic))
+}
+
+/// Get an iterator over all references in the repository
+///
+/// A gix reference iterator borrows the repository, so it can't be stored in
+/// the Python object. Instead only the reference names are listed up front,
+/// with the GIL released, and each reference is read as the iterator reaches
+/// it, on the calling thread and with the handle the names were listed with.
+pub(crate) fn iter_references(repo: &Repository, py: Python<'_>) -> PyResult<ReferenceIter> {
+    let inner = repo.inner.clone();
+    let (inner, names) = py.allow_threads(move || {
+        let platform = inner
+            .references()
+            .map_err(|err| repository_error(format!("Failed to get references: {}", err)))?;
+        let refs_iter = platform
+            .all()
+            .map_err(|err| repository_error(format!("Failed to get references: {}", err)))?;
+
+        let mut names = Vec::new();
+        for result in refs_iter {
+            match result {
+                Ok(r) => names.push(r.inner.name),
+                Err(err) => return Err(repository_error(format!("Error with reference: {}", err))),
+            }
         }
-    };
+        drop(platform);
 
-    let refs_iter = match platform.all() {
-        Ok(iter) => iter,
-        Err(err) => {
-            let msg = format!("Failed to get references: {}", err);
-            return Err(repository_error(msg));
+        Ok((inner, names))
+    })?;
+
+    Ok(ReferenceIter {
+        repo: inner,
+        names: names.into_iter(),
+    })
+}
+
+/// Read the next listed reference, skipping any that were deleted since
+pub(crate) fn next_reference(iter: &mut ReferenceIter) -> PyResult<Option<GitReference>> {
+    for name in iter.names.by_ref() {
+        let found = iter.repo.try_find_reference(&name).map_err(|err| {
+            let msg = format!("Failed to find reference {}: {}", name.as_bstr(), err);
+            repository_error(msg)
+        })?;
+
+        if let Some(r) = found {
+            // Convert the target based on its type
+            let (target, is_symbolic) = match r.inner.target {
+                gix_ref::Target::Symbolic(name) => (name.as_bstr().to_string(), true),
+                gix_ref::Target::Object(id) => (id.to_string(), false),
+            };
+
+            return Ok(Some(GitReference {
+                name: r.inner.name.as_bstr().to_string(),
+                target,
+                is_symbolic,
+            }));
         }
-    };
+    }
 
-    let mut refs = Vec::new();
-    for result in refs_iter {
-        match result {
-            Ok(r) => {
-                // Convert the target based on its type
-                let (target, is_symbolic) = match r.inner.target {
-                    gix_ref::Target::Symbolic(name) => (name.as_bstr().to_string(), true),
-                    gix_ref::Target::Object(id) => (id.to_string(), false),
-                };
-
-                refs.push(GitReference {
-                    name: r.inner.name.as_bstr().to_string(),
-                    target,
-                    is_symbolic,
-                });
-            }
-            Err(err) => {
-                let msg = format!("Error with reference: {}", err);
-                return Err(repository_error(msg));
+    Ok(None)
+}
+
+/// Count the references in the repository without reading them
+///
+/// Every entry of packed-refs and every validly named file below `refs/` is a
+/// reference, and a loose reference shadows a packed one of the same name, so
+/// the count is the loose names plus the packed names without a loose
+/// counterpart. The loose reference files are never opened, which means a
+/// malformed one is counted rather than reported. With a namespace or in a
+/// linked worktree references come from more than one place, so those fall
+/// back to walking them all.
+pub(crate) fn reference_count(repo: &Repository, py: Python<'_>) -> PyResult<usize> {
+    let inner = repo.inner.clone();
+    py.allow_threads(move || {
+        if inner.refs.namespace.is_some() || inner.refs.common_dir().is_some() {
+            return count_by_walking(&inner);
+        }
+
+        let mut loose = BTreeSet::new();
+        collect_loose_names(&inner.refs.git_dir().join("refs"), "refs".into(), &mut loose)?;
+
+        let packed = inner
+            .refs
+            .cached_packed_buffer()
+            .map_err(|err| repository_error(format!("Failed to read packed references: {}", err)))?;
+
+        let mut count = loose.len();
+        if let Some(packed) = packed {
+            let packed_iter = packed
+                .iter()
+                .map_err(|err| repository_error(format!("Failed to read packed references: {}", err)))?;
+            for result in packed_iter {
+                let r = result.map_err(|err| repository_error(format!("Error with packed reference: {}", err)))?;
+                if !loose.contains(r.name.as_bstr()) {
+                    count += 1;
+                }
             }
         }
+
+        Ok(count)
+    })
+}
+
+/// Add the names of the loose reference files below `dir` to `names`
+///
+/// `prefix` is the reference name that corresponds to `dir`, e.g. `refs/heads`.
+fn collect_loose_names(dir: &Path, prefix: BString, names: &mut BTreeSet<BString>) -> PyResult<()> {
+    let entries = match std::fs::read_dir(dir) {
+        Ok(entries) => entries,
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => return Ok(()),
+        Err(err) => return Err(repository_error(format!("Failed to read {}: {}", dir.display(), err))),
+    };
+
+    for entry in entries {
+        let entry = entry.map_err(|err| repository_error(format!("Failed to read {}: {}", dir.display(), err)))?;
+        let file_type = entry
+            .file_type()
+            .map_err(|err| repository_error(format!("Failed to read {}: {}", entry.path().display(), err)))?;
+
+        // Like gix itself, skip files whose names can't be reference names
+        let file_name = entry.file_name();
+        let Ok(file_name) = gix::path::os_str_into_bstr(&file_name) else {
+            continue;
+        };
+        let mut name = prefix.clone();
+        name.push(b'/');
+        name.extend_from_slice(file_name);
+
+        if file_type.is_dir() {
+            collect_loose_names(&entry.path(), name, names)?;
+        } else if file_type.is_file() && gix::validate::reference::name_partial(name.as_ref()).is_ok() {
+            names.insert(name);
+        }
     }
 
-    Ok(refs)
+    Ok(())
 }
 
-/// Get a list of all reference names in the repository
-pub(crate) fn reference_names(repo: &Repository) -> PyResult<Vec<String>> {
-    let platform = match repo.inner.references() {
+/// Count the references by reading every one of them
+fn count_by_walking(inner: &gix::Repository) -> PyResult<usize> {
+    let platform = match inner.references() {
         Ok(platform) => platform,
         Err(err) => {
             let msg = format!("Failed to get references: {}", err);
@@ -66,20 +237,53 @@ pub(crate) fn reference_names(repo: &Repository) -> PyResult<Vec<String>> {
         }
     };
 
-    let mut names = Vec::new();
+    let mut count = 0;
     for result in refs_iter {
-        match result {
-            Ok(r) => {
-                names.push(r.inner.name.as_bstr().to_string());
+        if let Err(err) = result {
+            let msg = format!("Error with reference: {}", err);
+            return Err(repository_error(msg));
+        }
+        count += 1;
+    }
+
+    Ok(count)
+}
+
+/// Get a list of all reference names in the repository
+pub(crate) fn reference_names(repo: &Repository, py: Python<'_>) -> PyResult<Vec<String>> {
+    let inner = repo.inner.clone();
+    py.allow_threads(move || {
+        let platform = match inner.references() {
+            Ok(platform) => platform,
+            Err(err) => {
+                let msg = format!("Failed to get references: {}", err);
+                return Err(repository_error(msg));
             }
+        };
+
+        let refs_iter = match platform.all() {
+            Ok(iter) => iter,
             Err(err) => {
-                let msg = format!("Error with reference: {}", err);
+                let msg = format!("Failed to get references: {}", err);
                 return Err(repository_error(msg));
             }
+        };
+
+        let mut names = Vec::new();
+        for result in refs_iter {
+            match result {
+                Ok(r) => {
+                    names.push(r.inner.name.as_bstr().to_string());
+                }
+                Err(err) => {
+                    let msg = format!("Error with reference: {}", err);
+                    return Err(repository_error(msg));
+                }
+            }
         }
-    }
 
-    Ok(names)
+        Ok(names)
+    })
 }
 
 /// Find a reference by name
@@ -3,17 +3,23 @@ use pyo3::prelude::*;
 
 use crate::errors::repository_error;
 use crate::repository::core::Repository;
+use crate::repository::objects::ObjectIdArg;
 
 /// Find all merge bases between one commit and multiple other commits
-pub(crate) fn merge_bases(repo: &Repository, one: &str, others: Vec<String>) -> PyResult<Vec<String>> {
+///
+/// The IDs are returned as they are so that callers can format them as hex
+/// strings or hand them to Python as raw bytes.
+pub(crate) fn merge_bases(repo: &Repository, one: &ObjectIdArg, others: &[ObjectIdArg]) -> PyResult<Vec<ObjectId>> {
     // Parse the first commit ID
-    let first_id = ObjectId::from_hex(one.as_bytes())
+    let first_id = one
+        .to_object_id()
         .map_err(|_| repository_error(format!("Invalid object ID for first commit: {}", one)))?;
 
     // Parse the other commit IDs
     let mut other_ids = Vec::with_capacity(others.len());
     for (idx, other) in others.iter().enumerate() {
-        let id = ObjectId::from_hex(other.as_bytes())
+        let id = other
+            .to_object_id()
             .map_err(|_| repository_error(format!("Invalid object ID for other commit {}: {}", idx, other)))?;
         other_ids.push(id);
     }
@@ -29,17 +35,14 @@ pub(crate) fn merge_bases(repo: &Repository, one: &str, others: Vec<String>) ->
     repo.inner
         .merge_bases_many_with_graph(first_id, &other_ids, &mut graph)
         .map_err(|err| repository_error(format!("Failed to find merge bases: {}", err)))
-        .map(|bases| bases.iter().map(|id| id.to_string()).collect())
+        .map(|bases| bases.into_iter().map(|id| id.detach()).collect())
 }
 
 /// Find the best merge base between two commits
-pub(crate) fn merge_base(repo: &Repository, one: &str, two: &str) -> PyResult<String> {
+pub(crate) fn merge_base(repo: &Repository, one: &ObjectIdArg, two: &ObjectIdArg) -> PyResult<String> {
     // Parse the commit IDs
-    let first_id = ObjectId::from_hex(one.as_bytes())
-        .map_err(|_| repository_error(format!("Invalid object ID for first commit: {}", one)))?;
-
-    let second_id = ObjectId::from_hex(two.as_bytes())
-        .map_err(|_| repository_error(format!("Invalid object ID for second commit: {}", two)))?;
+    let first_id = one.to_object_id()?;
+    let second_id = two.to_object_id()?;
 
     // Find the merge base
     repo.inner
@@ -48,6 +51,42 @@ pub(crate) fn merge_base(repo: &Repository, one: &str, two: &str) -> PyResult<St
         .map(|id| id.to_string())
 }
 
+/// Find the best merge base for each pair of commits
+///
+/// All queries share one revision graph, so the commits and generation numbers
+/// loaded while answering one pair are reused by the ones that follow.
+pub(crate) fn merge_base_pairs(
+    repo: &Repository,
+    py: Python<'_>,
+    pairs: Vec<(ObjectIdArg, ObjectIdArg)>,
+) -> PyResult<Vec<String>> {
+    // Parse the commit IDs
+    let mut ids = Vec::with_capacity(pairs.len());
+    for (one, two) in pairs.iter() {
+        ids.push((one.to_object_id()?, two.to_object_id()?));
+    }
+
+    // The traversals only read the object database, so don't hold the GIL meanwhile
+    let inner = repo.inner.clone();
+    py.allow_threads(move || {
+        let cache = inner
+            .commit_graph_if_enabled()
+            .map_err(|err| repository_error(format!("Failed to retrieve commit graph: {}", err)))?;
+        let mut graph = inner.revision_graph(cache.as_ref());
+
+        ids.into_iter()
+            .map(|(one, two)| {
+                inner
+                    .merge_base_with_graph(one, two, &mut graph)
+                    .map_err(|err| {
+                        repository_error(format!("Failed to find merge base of {} and {}: {}", one, two, err))
+                    })
+                    .map(|id| id.to_string())
+            })
+            .collect()
+    })
+}
+
 /// Parse a revision specification and return a single commit/object ID
 pub(crate) fn rev_parse(repo: &Repository, spec: &str) -> PyResult<String> {
     repo.inner
@@ -77,14 +116,15 @@ pub(crate) fn merge_base_octopus(repo: &Repository, commits: Vec<String>) -> PyR
     let commit_ids = commit_ids?;
 
     // Get the commit graph
-    let _cache = repo
+    let cache = repo
         .inner
         .commit_graph_if_enabled()
         .map_err(|err| repository_error(format!("Failed to retrieve commit graph: {}", err)))?;
+    let mut graph = repo.inner.revision_graph(cache.as_ref());
 
     // Find the merge base
     repo.inner
-        .merge_base_octopus(commit_ids)
+        .merge_base_octopus_with_graph(commit_ids, &mut graph)
         .map_err(|err| repository_error(format!("Failed to find merge base octopus: {}", err)))
         .map(|id| id.to_string())
 }
@@ -14,6 +14,7 @@ from .repository import (
     Tag,
     Header
 )
+from . import errors
 from .errors import (
     GitoxideError,
     RepositoryError,
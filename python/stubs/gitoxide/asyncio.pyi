@@ -4,7 +4,7 @@ Type stubs for the gitoxide.asyncio Python bindings.
 This module provides asynchronous variants of the gitoxide functionality.
 """
 
-from typing import Optional, overload
+from typing import AsyncIterator, List, Optional, Tuple, overload
 import pathlib
 import asyncio
 
@@ -120,4 +120,47 @@ class Repository:
         Raises:
             RepositoryError: If HEAD is not set or cannot be read
         """
-        ...
\ No newline at end of file
+        ...
+    async def rev_parse(self, spec: str) -> str:
+        """
+        Asynchronously parse a revision specification and return a single commit/object ID.
+
+        Resolves symbolic references such as HEAD in a single call.
+
+        Args:
+            spec: The revision specification (e.g., "HEAD", "main~3", "v1.0^{}")
+
+        Returns:
+            The object ID that the revision specification resolves to
+
+        Raises:
+            RepositoryError: If the specification is invalid or cannot be resolved
+        """
+        ...
+
+    async def references_columns(self) -> Tuple[List[str], List[str], List[bool]]:
+        """
+        Asynchronously get all references in the repository as parallel lists.
+
+        Returns:
+            Tuple of reference names, targets and symbolic flags, all of equal length
+        """
+        ...
+
+    def shallow_commits_stream(self, batch_size: int = 256) -> AsyncIterator[List[str]]:
+        """
+        Stream the shallow commits of the repository in batches.
+
+        Batches are produced in the background while earlier ones are consumed,
+        so the full list never has to be held on the Python side.
+
+        Args:
+            batch_size: Maximum number of commit IDs per batch
+
+        Returns:
+            Async iterator of commit ID lists; empty if the repository is not shallow
+
+        Raises:
+            RepositoryError: If the shallow file cannot be read
+        """
+        ...
@@ -2,7 +2,7 @@
 Type stubs for repository-related functionality in gitoxide.
 """
 
-from typing import Optional, List, Dict, Any, Union, Tuple, overload
+from typing import Optional, List, Dict, Any, Iterator, Union, Tuple, overload
 import pathlib
 
 
@@ -22,6 +22,7 @@ class Header:
 class Object:
     """A Git object."""
     id: str
+    raw_id: bytes
     kind: str
     data: bytes
 
@@ -99,6 +100,18 @@ class Config:
         """
         ...
 
+    def section_subsections(self, section: str) -> List[str]:
+        """
+        Get the subsection names of all sections with the given name.
+
+        Args:
+            section: The section name (e.g., "remote")
+
+        Returns:
+            A list of unique subsection names, e.g. the names of all configured remotes
+        """
+        ...
+
     def entries(self) -> Dict[str, str]:
         """
         List common configuration entries.
@@ -120,6 +133,20 @@ class Config:
         """
         ...
 
+    def reload(self) -> None:
+        """
+        Re-read the configuration from disk.
+
+        The configuration is loaded when the repository is opened; this picks up
+        later changes by re-reading only the configuration sources (global,
+        repository, worktree and environment, with includes followed). The
+        Repository the Config came from keeps the values it was opened with.
+
+        Raises:
+            ConfigError: If the configuration cannot be read
+        """
+        ...
+
 
 class Repository:
     """A Git repository."""
@@ -158,6 +185,27 @@ class Repository:
         """
         ...
 
+    @classmethod
+    def open_bare(cls, path: str) -> "Repository":
+        """
+        Open the repository whose git directory is exactly the given path.
+
+        The path is used as-is, without probing for a .git directory inside it,
+        and only the repository's own configuration is loaded. This is cheaper
+        than open() when the layout is known, e.g. for bare repositories or the
+        git directory of a repository that was just created.
+
+        Args:
+            path: Path to the repository's git directory
+
+        Returns:
+            Repository object
+
+        Raises:
+            RepositoryError: If the repository cannot be opened
+        """
+        ...
+
     @classmethod
     @overload
     def init(cls, path: str, bare: bool = False) -> "Repository":
@@ -212,6 +260,24 @@ class Repository:
         """
         ...
 
+    def git_dir_bytes(self) -> bytes:
+        """
+        Get the path to the repository's .git directory as bytes.
+
+        Returns:
+            The path as the operating system stores it, like os.fsencode() would produce
+        """
+        ...
+
+    def work_dir_bytes(self) -> Optional[bytes]:
+        """
+        Get the path to the repository's working directory as bytes, if it has one.
+
+        Returns:
+            The path as bytes, or None for bare repositories
+        """
+        ...
+
     def is_bare(self) -> bool:
         """
         Check if the repository is bare (has no working directory).
@@ -270,12 +336,12 @@ class Repository:
         """
         ...
 
-    def merge_bases(self, one: str, others: List[str]) -> List[str]:
+    def merge_bases(self, one: Union[str, bytes], others: List[Union[str, bytes]]) -> List[str]:
         """
         Find all merge bases between one commit and multiple other commits.
 
         Args:
-            one: First commit ID as a string
+            one: First commit ID as a hex string or as raw bytes
             others: List of other commit IDs to find merge bases with
 
         Returns:
@@ -286,13 +352,32 @@ class Repository:
         """
         ...
 
-    def merge_base(self, one: str, two: str) -> str:
+    def merge_bases_bytes(self, one: Union[str, bytes], others: List[Union[str, bytes]]) -> List[bytes]:
+        """
+        Find all merge bases between one commit and multiple other commits.
+
+        Like merge_bases(), but returns the IDs as raw bytes, which avoids
+        formatting them as hex when they are only passed back to other calls.
+
+        Args:
+            one: First commit ID as a hex string or as raw bytes
+            others: List of other commit IDs to find merge bases with
+
+        Returns:
+            List of commit IDs that are merge bases, as raw bytes
+
+        Raises:
+            RepositoryError: If one of the commit IDs is invalid
+        """
+        ...
+
+    def merge_base(self, one: Union[str, bytes], two: Union[str, bytes]) -> str:
         """
         Find the best merge base between two commits.
 
         Args:
-            one: First commit ID as a string
-            two: Second commit ID as a string
+            one: First commit ID as a hex string or as raw bytes
+            two: Second commit ID as a hex string or as raw bytes
 
         Returns:
             The commit ID of the merge base
@@ -302,6 +387,24 @@ class Repository:
         """
         ...
 
+    def merge_base_pairs(self, pairs: List[Tuple[Union[str, bytes], Union[str, bytes]]]) -> List[str]:
+        """
+        Find the best merge base for each of several pairs of commits.
+
+        All pairs are answered with one shared commit graph, which is much
+        faster than calling merge_base() once per pair when histories overlap.
+
+        Args:
+            pairs: A list of (one, two) commit ID pairs, as hex strings or raw bytes
+
+        Returns:
+            The commit ID of the merge base of each pair, in the same order
+
+        Raises:
+            RepositoryError: If a commit ID is invalid or a pair has no merge base
+        """
+        ...
+
     def merge_base_octopus(self, commits: List[str]) -> str:
         """
         Find the best merge base among multiple commits.
@@ -341,7 +444,7 @@ class Repository:
         """
         ...
 
-    def find_object(self, id: str) -> Object:
+    def find_object(self, id: Union[str, bytes]) -> Object:
         """
         Find a Git object by its ID.
 
@@ -356,7 +459,7 @@ class Repository:
         """
         ...
 
-    def find_blob(self, id: str) -> Blob:
+    def find_blob(self, id: Union[str, bytes]) -> Blob:
         """
         Find a Git blob by its ID.
 
@@ -371,7 +474,7 @@ class Repository:
         """
         ...
 
-    def find_commit(self, id: str) -> Commit:
+    def find_commit(self, id: Union[str, bytes]) -> Commit:
         """
         Find a Git commit by its ID.
 
@@ -386,7 +489,7 @@ class Repository:
         """
         ...
 
-    def find_tree(self, id: str) -> Tree:
+    def find_tree(self, id: Union[str, bytes]) -> Tree:
         """
         Find a Git tree by its ID.
 
@@ -401,7 +504,7 @@ class Repository:
         """
         ...
 
-    def find_tag(self, id: str) -> Tag:
+    def find_tag(self, id: Union[str, bytes]) -> Tag:
         """
         Find a Git tag by its ID.
 
@@ -416,7 +519,7 @@ class Repository:
         """
         ...
 
-    def find_header(self, id: str) -> Header:
+    def find_header(self, id: Union[str, bytes]) -> Header:
         """
         Find header information for a Git object.
 
@@ -431,7 +534,7 @@ class Repository:
         """
         ...
 
-    def has_object(self, id: str) -> bool:
+    def has_object(self, id: Union[str, bytes]) -> bool:
         """
         Check if an object exists in the repository.
 
@@ -443,6 +546,96 @@ class Repository:
         """
         ...
 
+    def has_objects(self, ids: List[Union[str, bytes]]) -> List[bool]:
+        """
+        Check which of several objects exist in the repository.
+
+        Args:
+            ids: Object IDs to check
+
+        Returns:
+            A list with True for each object that exists, in the order of ids
+
+        Raises:
+            RepositoryError: If one of the IDs is invalid
+        """
+        ...
+
+    def find_headers(self, ids: List[Union[str, bytes]]) -> List[Header]:
+        """
+        Find header information for several Git objects.
+
+        Args:
+            ids: Object IDs to find
+
+        Returns:
+            Header information for each object, in the order of ids
+
+        Raises:
+            RepositoryError: If one of the IDs is invalid or an object cannot be found
+        """
+        ...
+
+    def write_blob(self, data: bytes) -> str:
+        """
+        Write a blob to the object database.
+
+        Args:
+            data: Content of the blob
+
+        Returns:
+            ID of the written blob
+
+        Raises:
+            RepositoryError: If the blob cannot be written
+        """
+        ...
+
+    def write_tree(self, entries: List[Tuple[str, Union[str, bytes]]]) -> str:
+        """
+        Write a tree to the object database.
+
+        Args:
+            entries: List of (filename, object ID) pairs, with each ID as a hex
+                string or as raw bytes; the entry mode is derived from the kind
+                of the referenced object
+
+        Returns:
+            ID of the written tree
+
+        Raises:
+            RepositoryError: If an entry is invalid or the tree cannot be written
+        """
+        ...
+
+    def commit(
+        self,
+        reference: str,
+        message: str,
+        tree: Union[str, bytes],
+        parents: List[Union[str, bytes]],
+        author_name: Optional[str] = None,
+        author_email: Optional[str] = None,
+    ) -> str:
+        """
+        Create a new commit and update a reference to point to it.
+
+        Args:
+            reference: Reference to update (e.g., "HEAD" or "refs/heads/main")
+            message: Commit message
+            tree: ID of the tree to commit, as a hex string or as raw bytes
+            parents: List of parent commit IDs, as hex strings or raw bytes
+            author_name: Name used as author and committer, or None for the configured identity
+            author_email: Email used as author and committer, or None for the configured identity
+
+        Returns:
+            ID of the new commit
+
+        Raises:
+            RepositoryError: If the commit cannot be created
+        """
+        ...
+
     def references(self) -> List[Reference]:
         """
         Get all references in the repository.
@@ -452,6 +645,45 @@ class Repository:
         """
         ...
 
+    def iter_references(self) -> Iterator[Reference]:
+        """
+        Iterate over all references in the repository.
+
+        Only the reference names are listed up front. Each reference is read
+        from disk as the iterator reaches it and is never collected into a
+        list, which is cheaper than references() when only some of them are
+        needed. References deleted in the meantime are skipped.
+
+        Returns:
+            Iterator of references
+
+        Raises:
+            RepositoryError: While iterating, if the references cannot be read
+        """
+        ...
+
+    def reference_count(self) -> int:
+        """
+        Count the references in the repository.
+
+        The names in packed-refs and of the loose reference files are counted
+        without reading the references themselves, so a malformed loose
+        reference is counted instead of raising an error.
+
+        Returns:
+            Number of references
+        """
+        ...
+
+    def references_columns(self) -> Tuple[List[str], List[str], List[bool]]:
+        """
+        Get all references in the repository as parallel lists.
+
+        Returns:
+            Tuple of reference names, targets and symbolic flags, all of equal length
+        """
+        ...
+
     def reference_names(self) -> List[str]:
         """
         Get names of all references in the repository.
@@ -0,0 +1,72 @@
+"""
+Per-test banners for the gitoxide test suite.
+
+Loaded and registered by tests/conftest.py when pytest runs with --gitoxide-verbose.
+"""
+import sys
+import time
+
+import pytest
+
+_SETUP_RULE = "=" * 80
+_TEARDOWN_RULE = "-" * 80
+_test_id_key = pytest.StashKey[str]()
+
+
+def _test_id(item):
+    """Return "module.Class.test" for an item, computed once per item."""
+    test_id = item.stash.get(_test_id_key, None)
+    if test_id is None:
+        class_name = item.cls.__name__ if item.cls else "None"
+        test_id = f"{item.module.__name__}.{class_name}.{item.name}"
+        item.stash[_test_id_key] = test_id
+    return test_id
+
+
+def _now():
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Print test name and docstring at the start of each test."""
+    test_doc = item.obj.__doc__ or "No docstring provided"
+    # sys.stdout is looked up per call since pytest swaps it while capturing
+    sys.stdout.write("\n".join((
+        "",
+        _SETUP_RULE,
+        f"RUNNING TEST: {_test_id(item)}",
+        f"DESCRIPTION: {test_doc.strip()}",
+        f"START TIME: {_now()}",
+        _SETUP_RULE,
+        "",
+    )))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Print test completion message."""
+    sys.stdout.write("\n".join((
+        "",
+        _TEARDOWN_RULE,
+        f"COMPLETED: {_test_id(item)}",
+        f"END TIME: {_now()}",
+        _TEARDOWN_RULE,
+        "",
+    )))
+
+
+def pytest_runtest_logreport(report):
+    """Print the result of each test call."""
+    if report.when != "call":
+        return
+
+    # Format the test result
+    status = "PASSED" if report.passed else "FAILED" if report.failed else "SKIPPED"
+    lines = ["", f"RESULT: {status} - {report.nodeid}"]
+
+    # If the test failed, include the error information
+    if report.failed:
+        lines.append(f"ERROR: {report.longreprtext}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
@@ -1,61 +1,153 @@
 """
 Configuration for pytest.
 """
+import importlib.util
+import os
+import tempfile
+
 import pytest
-import time
 
 # The pytest_plugins configuration has been moved to the top-level conftest.py
-# as required by newer versions of pytest
-
-
-@pytest.hookimpl(tryfirst=True)
-def pytest_runtest_setup(item):
-    """Print test name and docstring at the start of each test."""
-    # Get the module name (file), class name, and test name
-    module_name = item.module.__name__
-    class_name = item.cls.__name__ if item.cls else "None"
-    test_name = item.name
-    test_doc = item.obj.__doc__ or "No docstring provided"
-
-    # Format the test information
-    print(f"\n{'='*80}")
-    print(f"RUNNING TEST: {module_name}.{class_name}.{test_name}")
-    print(f"DESCRIPTION: {test_doc.strip()}")
-    print(f"START TIME: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'='*80}")
-
-
-@pytest.hookimpl(trylast=True)
-def pytest_runtest_teardown(item, nextitem):
-    """Print test completion message."""
-    # Get the module name (file), class name, and test name
-    module_name = item.module.__name__
-    class_name = item.cls.__name__ if item.cls else "None"
-    test_name = item.name
-
-    # Format the test completion information
-    print(f"\n{'-'*80}")
-    print(f"COMPLETED: {module_name}.{class_name}.{test_name}")
-    print(f"END TIME: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'-'*80}")
-
-
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    outcome = yield
-    report = outcome.get_result()
-
-    if report.when == "call":
-        # Get the module name (file), class name, and test name
-        module_name = item.module.__name__
-        class_name = item.cls.__name__ if item.cls else "None"
-        test_name = item.name
-
-        # Format the test result
-        status = "PASSED" if report.passed else "FAILED" if report.failed else "SKIPPED"
-        print(f"\nRESULT: {status} - {module_name}.{class_name}.{test_name}")
-
-        # If the test failed, print the error information
-        if report.failed:
-            if hasattr(report, "longrepr"):
-                print(f"ERROR: {report.longreprtext}")
+# as required by newer versions of pytest. The per-test banners live in
+# _verbose_banners.py next to this file and are enabled with --gitoxide-verbose.
+
+
+def _config_value(value):
+    """Quote a value for a git config file."""
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _write_git_config(repo_dir, entries):
+    """
+    Append entries to the repository's config file in a single write.
+
+    Keys are dotted ("user.name", "remote.origin.url"); a list value adds the
+    key once per item, like repeated `git config --add` calls. Writing the
+    file directly avoids spawning a shell and git for every value.
+    """
+    lines = []
+    for key, values in entries.items():
+        section, _, name = key.rpartition(".")
+        section, _, subsection = section.partition(".")
+        header = f'[{section} "{subsection}"]' if subsection else f"[{section}]"
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        lines.append(header)
+        lines.extend(f"\t{name} = {_config_value(value)}" for value in values)
+
+    git_dir = os.path.join(repo_dir, ".git")
+    if not os.path.isdir(git_dir):
+        git_dir = repo_dir
+    with open(os.path.join(git_dir, "config"), "a") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def write_git_config():
+    """Provide a helper that writes config entries straight into a repository."""
+    return _write_git_config
+
+
+def _create_repo_with_commit(temp_dir):
+    """Initialize a repository in temp_dir with a single commit."""
+    # Imported here so a missing extension only fails the tests that need it
+    import gitoxide
+
+    # Initialize the repository
+    repo = gitoxide.Repository.init(temp_dir, bare=False)
+
+    # Add a file and commit it, writing the objects directly instead of
+    # running git add/commit
+    readme = b"# Test Repository\n\nThis is a test repository."
+    with open(os.path.join(temp_dir, "README.md"), "wb") as f:
+        f.write(readme)
+
+    blob_id = repo.write_blob(readme)
+    tree_id = repo.write_tree([("README.md", blob_id)])
+    commit_id = repo.commit("HEAD", "Initial commit", tree_id, [],
+                            author_name="Test User",
+                            author_email="test@example.com")
+
+    return repo, commit_id
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_gitoxide(tmp_path_factory):
+    """
+    Load the extension and initialize a throwaway repository once per session.
+
+    This moves the one-off cost of loading the cdylib and its first repository
+    setup out of whichever test happens to run first on each worker.
+    """
+    try:
+        import gitoxide
+    except ImportError:
+        # Leave the failure to the tests that actually import it
+        return
+    gitoxide.Repository.init(str(tmp_path_factory.mktemp("warm")), bare=False)
+
+
+@pytest.fixture(scope="module")
+def repo_with_commit():
+    """Create a repository with a single commit, shared by a module's read-only tests."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield _create_repo_with_commit(temp_dir)
+
+
+@pytest.fixture
+def fresh_repo_with_commit():
+    """Create a repository with a single commit for tests that modify it."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield _create_repo_with_commit(temp_dir)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--gitoxide-verbose", action="store_true", default=False,
+        help="print a banner with name, description and timing around each test")
+    parser.addoption(
+        "--gitoxide-shm", action="store_true", default=False,
+        help="create temporary repositories in /dev/shm instead of on disk")
+
+
+def _use_shared_memory_tempdir(config):
+    """
+    Put temporary repositories on /dev/shm if asked to and it is available.
+
+    Every test creates a repository, and git writes many small files under
+    .git/, so keeping them in memory instead of on disk speeds the suite up.
+    pytest derives its numbered tmp_path directories from tempfile.gettempdir(),
+    so setting tempfile.tempdir moves both tmp_path and TemporaryDirectory.
+    This is opt-in because /dev/shm is often small, e.g. 64 MB in a Docker
+    container, and an explicit --basetemp or TMPDIR is left alone.
+    """
+    if not config.getoption("--gitoxide-shm"):
+        return
+    if config.option.basetemp or "TMPDIR" in os.environ:
+        return
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK | os.X_OK):
+        tempfile.tempdir = "/dev/shm"
+
+
+def _load_verbose_banners():
+    """
+    Load the banner plugin from the file next to this conftest.
+
+    Loading it by path keeps it from depending on sys.path, where a generic
+    module name could resolve to an unrelated package.
+    """
+    spec = importlib.util.spec_from_file_location(
+        "gitoxide_tests_verbose_banners",
+        os.path.join(os.path.dirname(__file__), "_verbose_banners.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def pytest_configure(config):
+    _use_shared_memory_tempdir(config)
+
+    # The banners are opt-in; plain runs rely on pytest's own -v output
+    if config.getoption("--gitoxide-verbose"):
+        config.pluginmanager.register(_load_verbose_banners(), "gitoxide-verbose")
@@ -1,43 +1,41 @@
 import os
 import pytest
+import pytest_asyncio
 import asyncio
-import tempfile
-import shutil
 from pathlib import Path
 
-# Check if the async feature is available
+# Check if the async feature is available. Only the build flag is read here;
+# gitoxide.asyncio is imported by the fixture and tests that actually run.
 try:
-    import gitoxide
-    if hasattr(gitoxide, 'asyncio'):
-        from gitoxide.asyncio import Repository
-        ASYNC_AVAILABLE = True
-    else:
-        ASYNC_AVAILABLE = False
+    from gitoxide.gitoxide import ASYNC_AVAILABLE
 except ImportError:
     ASYNC_AVAILABLE = False
 
-pytestmark = pytest.mark.asyncio
-
-# Skip all tests if async feature is not available
-pytestmark = pytest.mark.skipif(not ASYNC_AVAILABLE, reason="Async feature not available")
+pytestmark = [
+    # Run every test on one shared event loop instead of a new loop per test
+    pytest.mark.asyncio(loop_scope="session"),
+    # Skip all tests if async feature is not available
+    pytest.mark.skipif(not ASYNC_AVAILABLE, reason="Async feature not available"),
+]
 
 # Fixture for creating a simple git repository
-@pytest.fixture
-async def simple_repo_path():
-    # Create a temporary directory
-    temp_dir = tempfile.mkdtemp()
-    try:
-        # Initialize a repository
-        repo = await Repository.init(temp_dir, False)
-        yield temp_dir
-    finally:
-        # Clean up the temporary directory
-        shutil.rmtree(temp_dir)
+@pytest_asyncio.fixture(loop_scope="session")
+async def simple_repo(tmp_path):
+    """Return the freshly initialized repository together with its path."""
+    from gitoxide.asyncio import Repository
+
+    # pytest creates and cleans up tmp_path
+    repo_path = str(tmp_path / "repo")
+    repo = await Repository.init(repo_path, False)
+    return repo, repo_path
 
 # Test basic repository operations
-async def test_open_and_init(simple_repo_path):
+async def test_open_and_init(simple_repo):
     # Test init (already done in fixture)
-    repo = await Repository.open(simple_repo_path)
+    from gitoxide.asyncio import Repository
+
+    _, repo_path = simple_repo
+    repo = await Repository.open(repo_path)
     
     # Basic checks
     assert not repo.is_bare()
@@ -45,8 +43,8 @@ async def test_open_and_init(simple_repo_path):
     assert repo.work_dir() is not None
 
 # Test shallow repository properties
-async def test_shallow_properties(simple_repo_path):
-    repo = await Repository.open(simple_repo_path)
+async def test_shallow_properties(simple_repo):
+    repo, _ = simple_repo
     
     # This is a new repo, not a shallow clone
     assert not repo.is_shallow()
@@ -56,16 +54,20 @@ async def test_shallow_properties(simple_repo_path):
     shallow_commits = await repo.shallow_commits()
     assert shallow_commits is None
 
+    # Streaming yields no batches for non-shallow repos
+    batches = [batch async for batch in repo.shallow_commits_stream()]
+    assert batches == []
+
 # Test object hash property
-async def test_object_hash(simple_repo_path):
-    repo = await Repository.open(simple_repo_path)
+async def test_object_hash(simple_repo):
+    repo, _ = simple_repo
     
     # Most git repos use SHA1 by default
     assert repo.object_hash() == "Sha1"
 
 # Test repository HEAD
-async def test_head(simple_repo_path):
-    repo = await Repository.open(simple_repo_path)
+async def test_head(simple_repo):
+    repo, _ = simple_repo
     
     # A new repo might not have HEAD set to a branch yet
     # This might raise an exception, but we're just testing the async functionality
@@ -76,13 +78,31 @@ async def test_head(simple_repo_path):
         # This is expected in a new repo with no commits
         assert "HEAD is not set" in str(e)
 
+# Test that independent async calls can be awaited together
+async def test_concurrent_calls(simple_repo):
+    repo, _ = simple_repo
+
+    # Each call runs on its own blocking task, so they overlap
+    shallow_commits, head, columns = await asyncio.gather(
+        repo.shallow_commits(),
+        repo.head(),
+        repo.references_columns(),
+        return_exceptions=True,
+    )
+
+    assert shallow_commits is None
+    # A new repo may have no HEAD yet; the error must not affect the other calls
+    assert isinstance(head, (str, Exception))
+    names, targets, symbolic = columns
+    assert len(names) == len(targets) == len(symbolic)
+
 """
 # Additional tests for references and objects
 # These tests require a repository with actual content
 # Uncomment and modify these when testing with a repo that has commits
 
-async def test_references(simple_repo_path):
-    repo = await Repository.open(simple_repo_path)
+async def test_references(simple_repo):
+    repo, _ = simple_repo
     
     # Get all references
     refs = await repo.references()
@@ -100,9 +120,9 @@ async def test_references(simple_repo_path):
         # May not exist in a new repo
         pass
 
-async def test_create_reference(simple_repo_path):
+async def test_create_reference(simple_repo):
     # This test requires a repository with at least one commit
-    repo = await Repository.open(simple_repo_path)
+    repo, _ = simple_repo
     
     # To test this properly, we'd need a commit ID
     # For now, we're just testing that the async method exists and can be called
@@ -113,9 +133,9 @@ async def test_create_reference(simple_repo_path):
         # This will likely fail in a new repo, but we're just testing the async API
         pass
 
-async def test_object_operations(simple_repo_path):
+async def test_object_operations(simple_repo):
     # This test requires a repository with objects
-    repo = await Repository.open(simple_repo_path)
+    repo, _ = simple_repo
     
     # Need an object ID to test with
     # For a new repo, we won't have any, so these will fail
@@ -0,0 +1,59 @@
+"""
+Benchmarks for performance-critical gitoxide operations.
+
+These run with pytest-benchmark and are marked slow, since each one builds a
+large history first; see the README for comparing runs against a baseline.
+"""
+
+import pytest
+import gitoxide
+
+pytest.importorskip("pytest_benchmark")
+
+# Commits on each side of the fork in big_dag
+BRANCH_LENGTH = 500
+
+
+@pytest.fixture(scope="module")
+def big_dag(tmp_path_factory):
+    """
+    Build a history of two long branches that fork from a single root.
+
+    The merge base of the two tips is the root, so finding it has to walk all
+    commits on both sides. Returns (repo, root, tip1, tip2).
+    """
+    repo = gitoxide.Repository.init(str(tmp_path_factory.mktemp("big_dag")), bare=False)
+    # Every commit reuses the empty tree; only the shape of the history matters
+    tree_id = repo.write_tree([])
+
+    def commit(reference, message, parents):
+        return repo.commit(reference, message, tree_id, parents,
+                           author_name="Test User",
+                           author_email="test@example.com")
+
+    root = commit("HEAD", "Root", [])
+    tips = []
+    for side in ("one", "two"):
+        tip = root
+        for i in range(BRANCH_LENGTH):
+            tip = commit(f"refs/heads/{side}", f"{side} {i}", [tip])
+        tips.append(tip)
+    return repo, root, tips[0], tips[1]
+
+
+@pytest.mark.slow
+class TestMergeBaseBenchmarks:
+    """Benchmarks for merge-base queries on a large history."""
+
+    def test_merge_base_perf(self, benchmark, big_dag):
+        """Measure how long finding the merge base of two long branches takes."""
+        repo, root, tip1, tip2 = big_dag
+
+        assert benchmark(repo.merge_base, tip1, tip2) == root
+
+    def test_merge_base_pairs_perf(self, benchmark, big_dag):
+        """Measure answering many queries on the same history with one graph."""
+        repo, root, tip1, tip2 = big_dag
+        pairs = [(tip1, tip2)] * 10
+
+        assert benchmark(repo.merge_base_pairs, pairs) == [root] * 10
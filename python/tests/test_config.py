@@ -2,7 +2,6 @@
 Tests for the gitoxide Configuration functionality.
 """
 
-import os
 import tempfile
 import pytest
 import gitoxide
@@ -11,18 +10,19 @@ import gitoxide
 class TestConfig:
     """Tests for the Config class."""
 
-    def test_basic_config_access(self):
+    def test_basic_config_access(self, write_git_config):
         """Test basic access to configuration values."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Initialize a repository
             repo = gitoxide.Repository.init(temp_dir, bare=False)
 
             # Configure test values
-            os.system(f"cd {temp_dir} && git config user.name 'Test User'")
-            os.system(
-                f"cd {temp_dir} && git config user.email 'test@example.com'")
-            os.system(f"cd {temp_dir} && git config core.bare false")
-            os.system(f"cd {temp_dir} && git config core.compression 9")
+            write_git_config(temp_dir, {
+                "user.name": "Test User",
+                "user.email": "test@example.com",
+                "core.bare": "false",
+                "core.compression": 9,
+            })
 
             # Get config object
             config = repo.config()
@@ -42,14 +42,14 @@ class TestConfig:
             assert config.boolean("non.existent") is None
             assert config.integer("non.existent") is None
 
-    def test_has_key(self):
+    def test_has_key(self, write_git_config):
         """Test checking if keys exist in the configuration."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Initialize a repository
             repo = gitoxide.Repository.init(temp_dir, bare=False)
 
             # Configure test values
-            os.system(f"cd {temp_dir} && git config user.name 'Test User'")
+            write_git_config(temp_dir, {"user.name": "Test User"})
 
             # Get config object
             config = repo.config()
@@ -58,17 +58,19 @@ class TestConfig:
             assert config.has_key("user.name") is True
             assert config.has_key("non.existent") is False
 
-    def test_multi_valued_config(self):
+    def test_multi_valued_config(self, write_git_config):
         """Test retrieving multi-valued configuration entries."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Initialize a repository
             repo = gitoxide.Repository.init(temp_dir, bare=False)
 
             # Configure multi-valued remotes
-            os.system(
-                f"cd {temp_dir} && git config --add remote.origin.fetch '+refs/heads/*:refs/remotes/origin/*'")
-            os.system(
-                f"cd {temp_dir} && git config --add remote.origin.fetch '+refs/tags/*:refs/tags/*'")
+            write_git_config(temp_dir, {
+                "remote.origin.fetch": [
+                    "+refs/heads/*:refs/remotes/origin/*",
+                    "+refs/tags/*:refs/tags/*",
+                ],
+            })
 
             # Get config object
             config = repo.config()
@@ -85,17 +87,18 @@ class TestConfig:
                 assert values[0] in [
                     "+refs/heads/*:refs/remotes/origin/*", "+refs/tags/*:refs/tags/*"]
 
-    def test_entries_dictionary(self):
+    def test_entries_dictionary(self, write_git_config):
         """Test retrieving a dictionary of common configuration entries."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Initialize a repository
             repo = gitoxide.Repository.init(temp_dir, bare=False)
 
             # Configure test values
-            os.system(f"cd {temp_dir} && git config user.name 'Test User'")
-            os.system(
-                f"cd {temp_dir} && git config user.email 'test@example.com'")
-            os.system(f"cd {temp_dir} && git config core.bare false")
+            write_git_config(temp_dir, {
+                "user.name": "Test User",
+                "user.email": "test@example.com",
+                "core.bare": "false",
+            })
 
             # Get config object
             config = repo.config()
@@ -116,6 +119,39 @@ class TestConfig:
                 if default_branch:
                     assert entries.get("init.defaultBranch") == default_branch
 
+    def test_section_subsections(self, write_git_config):
+        """Test listing the subsections of a section."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Initialize a repository
+            repo = gitoxide.Repository.init(temp_dir, bare=False)
+
+            # Configure two remotes
+            write_git_config(temp_dir, {
+                "remote.origin.url": "https://example.com/origin.git",
+                "remote.upstream.url": "https://example.com/upstream.git",
+            })
+
+            # Get config object
+            config = repo.config()
+
+            assert sorted(config.section_subsections("remote")) == [
+                "origin", "upstream"]
+            assert config.section_subsections("non-existent") == []
+
+    def test_reload(self, write_git_config):
+        """Test that reload picks up changes made to the config file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = gitoxide.Repository.init(temp_dir, bare=False)
+            config = repo.config()
+            assert config.string("test.reloaded") is None
+
+            # The file changes after the configuration was loaded
+            write_git_config(temp_dir, {"test.reloaded": "yes"})
+            assert config.string("test.reloaded") is None
+
+            config.reload()
+            assert config.string("test.reloaded") == "yes"
+
     def test_indexed_multi_values(self):
         """Test handling of indexed multi-valued configuration entries."""
         # Skip this test for now as the implementation doesn't support
@@ -123,7 +159,7 @@ class TestConfig:
         pytest.skip(
             "multi-value indexing not supported in current implementation")
 
-    def test_different_data_types(self):
+    def test_different_data_types(self, write_git_config):
         """Test handling different data types in configuration."""
         with tempfile.TemporaryDirectory() as temp_dir:
             # Initialize a repository
@@ -143,9 +179,7 @@ class TestConfig:
                 assert isinstance(config.string("core.ignorecase"), str)
 
             # Verify type conversion for a string value
-            os.system(
-                f"cd {temp_dir} && git config user.name 'Data Type Test'")
-            # Need to re-open to get updated config
-            repo = gitoxide.Repository.open(temp_dir)
-            config = repo.config()
+            write_git_config(temp_dir, {"user.name": "Data Type Test"})
+            # Re-read the config files instead of re-opening the repository
+            config.reload()
             assert config.string("user.name") == "Data Type Test"
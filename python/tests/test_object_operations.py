@@ -2,9 +2,8 @@
 Tests for Git object operations in gitoxide.
 """
 
+import hashlib
 import os
-import tempfile
-import subprocess
 import pytest
 import gitoxide
 
@@ -12,34 +11,6 @@ import gitoxide
 class TestObjectOperations:
     """Tests for Git object operations."""
 
-    @pytest.fixture
-    def repo_with_commit(self):
-        """Create a repository with a single commit."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize the repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-            
-            # Configure Git
-            subprocess.run(["git", "config", "--global", "user.email", "test@example.com"], check=True)
-            subprocess.run(["git", "config", "--global", "user.name", "Test User"], check=True)
-            
-            # Add a file and commit it
-            readme_path = os.path.join(temp_dir, "README.md")
-            with open(readme_path, "w") as f:
-                f.write("# Test Repository\n\nThis is a test repository.")
-            
-            subprocess.run(["git", "add", "README.md"], cwd=temp_dir, check=True)
-            subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=temp_dir, check=True)
-            
-            # Get commit ID
-            commit_id = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"], 
-                cwd=temp_dir, 
-                universal_newlines=True
-            ).strip()
-            
-            yield repo, commit_id
-
     def test_has_object(self, repo_with_commit):
         """Test has_object method."""
         repo, commit_id = repo_with_commit
@@ -71,6 +42,31 @@ class TestObjectOperations:
         with pytest.raises(Exception):
             repo.find_header(non_existent_id)
 
+    def test_has_objects(self, repo_with_commit):
+        """Test has_objects method."""
+        repo, commit_id = repo_with_commit
+
+        non_existent_id = "0" * 40
+        assert repo.has_objects([commit_id, non_existent_id]) == [True, False]
+        assert repo.has_objects([]) == []
+
+        # A single invalid ID fails the whole batch
+        with pytest.raises(Exception):
+            repo.has_objects([commit_id, "not-a-valid-id"])
+
+    def test_find_headers(self, repo_with_commit):
+        """Test find_headers method."""
+        repo, commit_id = repo_with_commit
+
+        tree_id = repo.rev_parse("HEAD^{tree}")
+        headers = repo.find_headers([commit_id, tree_id])
+        assert [header.kind for header in headers] == ["Commit", "Tree"]
+        assert headers[0].size == repo.find_header(commit_id).size
+
+        # Test with a non-existent object
+        with pytest.raises(Exception):
+            repo.find_headers([commit_id, "0" * 40])
+
     def test_find_object(self, repo_with_commit):
         """Test find_object method."""
         repo, commit_id = repo_with_commit
@@ -100,16 +96,29 @@ class TestObjectOperations:
         assert commit.kind == "Commit"
         assert len(commit.data) > 0
 
+    def test_raw_object_ids(self, repo_with_commit):
+        """Test passing and reading object IDs as raw bytes."""
+        repo, commit_id = repo_with_commit
+
+        commit = repo.find_commit(commit_id)
+        assert commit.raw_id == bytes.fromhex(commit_id)
+        assert commit.raw_id.hex() == commit.id
+
+        # Raw IDs are accepted wherever hex IDs are
+        assert repo.find_commit(commit.raw_id).id == commit_id
+        assert repo.has_object(commit.raw_id)
+        assert repo.find_header(commit.raw_id).kind == "Commit"
+        assert repo.has_objects([commit.raw_id, commit_id]) == [True, True]
+
+        with pytest.raises(Exception):
+            repo.has_object(b"too short")
+
     def test_find_tree(self, repo_with_commit):
         """Test find_tree method."""
         repo, commit_id = repo_with_commit
 
         # Get the tree from the commit
-        tree_id = subprocess.check_output(
-            ["git", "rev-parse", "HEAD^{tree}"],
-            cwd=os.path.dirname(repo.git_dir()),
-            universal_newlines=True
-        ).strip()
+        tree_id = repo.rev_parse("HEAD^{tree}")
 
         # Get the tree
         tree = repo.find_tree(tree_id)
@@ -123,13 +132,11 @@ class TestObjectOperations:
         """Test find_blob method."""
         repo, commit_id = repo_with_commit
 
-        # Get blob ID for README.md
-        readme_path = os.path.join(os.path.dirname(repo.git_dir()), "README.md")
-        blob_id = subprocess.check_output(
-            ["git", "hash-object", readme_path],
-            cwd=os.path.dirname(repo.git_dir()),
-            universal_newlines=True
-        ).strip()
+        # Get blob ID for README.md, hashed the way git does it
+        readme_path = os.path.join(repo.work_dir(), "README.md")
+        with open(readme_path, "rb") as f:
+            content = f.read()
+        blob_id = hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
 
         # Get the blob
         blob = repo.find_blob(blob_id)
@@ -137,4 +144,39 @@ class TestObjectOperations:
         # Check blob properties
         assert blob.id == blob_id
         assert blob.kind == "Blob"
-        assert b"# Test Repository" in blob.data
\ No newline at end of file
+        assert blob.data.startswith(b"# Test Repository")
+
+    def test_write_objects(self, fresh_repo_with_commit):
+        """Test writing blobs, trees and commits."""
+        repo, commit_id = fresh_repo_with_commit
+
+        # Write a blob and read it back
+        blob_id = repo.write_blob(b"Second file\n")
+        assert repo.find_blob(blob_id).data == b"Second file\n"
+
+        # Write a tree containing the blob
+        tree_id = repo.write_tree([("second.txt", blob_id)])
+        assert repo.find_header(tree_id).kind == "Tree"
+
+        # Commit the tree on top of the existing commit
+        new_commit_id = repo.commit(
+            "HEAD", "Second commit", tree_id, [commit_id],
+            author_name="Test User", author_email="test@example.com")
+        assert repo.find_header(new_commit_id).kind == "Commit"
+        assert repo.rev_parse("HEAD") == new_commit_id
+        assert repo.rev_parse("HEAD^") == commit_id
+        assert repo.rev_parse("HEAD^{tree}") == tree_id
+
+        # Raw IDs are accepted as well as hex strings
+        raw_tree_id = repo.write_tree([("second.txt", bytes.fromhex(blob_id))])
+        assert raw_tree_id == tree_id
+        raw_commit_id = repo.commit(
+            "refs/heads/raw", "Raw commit", bytes.fromhex(tree_id), [bytes.fromhex(new_commit_id)],
+            author_name="Test User", author_email="test@example.com")
+        assert repo.rev_parse("refs/heads/raw^") == new_commit_id
+        assert repo.rev_parse("refs/heads/raw") == raw_commit_id
+
+        # Author name and email must be given together
+        with pytest.raises(Exception):
+            repo.commit("HEAD", "Bad commit", tree_id, [new_commit_id],
+                        author_name="Test User")
@@ -3,8 +3,7 @@ Tests for Git reference operations in gitoxide.
 """
 
 import os
-import tempfile
-import subprocess
+
 import pytest
 import gitoxide
 
@@ -12,34 +11,6 @@ import gitoxide
 class TestReferenceOperations:
     """Tests for Git reference operations."""
 
-    @pytest.fixture
-    def repo_with_commit(self):
-        """Create a repository with a single commit."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize the repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-            
-            # Configure Git
-            subprocess.run(["git", "config", "--global", "user.email", "test@example.com"], check=True)
-            subprocess.run(["git", "config", "--global", "user.name", "Test User"], check=True)
-            
-            # Add a file and commit it
-            readme_path = os.path.join(temp_dir, "README.md")
-            with open(readme_path, "w") as f:
-                f.write("# Test Repository\n\nThis is a test repository.")
-            
-            subprocess.run(["git", "add", "README.md"], cwd=temp_dir, check=True)
-            subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=temp_dir, check=True)
-            
-            # Get commit ID
-            commit_id = subprocess.check_output(
-                ["git", "rev-parse", "HEAD"], 
-                cwd=temp_dir, 
-                universal_newlines=True
-            ).strip()
-            
-            yield repo, commit_id
-
     def test_references(self, repo_with_commit):
         """Test references method."""
         repo, commit_id = repo_with_commit
@@ -59,6 +30,68 @@ class TestReferenceOperations:
             assert isinstance(ref.target, str)
             assert isinstance(ref.is_symbolic, bool)
 
+    def test_iter_references(self, repo_with_commit):
+        """Test iter_references and reference_count methods."""
+        repo, commit_id = repo_with_commit
+
+        refs = repo.references()
+        assert repo.reference_count() == len(refs)
+
+        # The iterator yields the same references as the list
+        it = repo.iter_references()
+        assert [ref.name for ref in it] == [ref.name for ref in refs]
+
+        # Once exhausted it stays exhausted
+        assert next(it, None) is None
+
+    def test_reference_count_packed(self, fresh_repo_with_commit):
+        """Test that reference_count counts packed references once."""
+        repo, commit_id = fresh_repo_with_commit
+        repo.create_reference("refs/tags/loose", commit_id, is_symbolic=False, force=False)
+
+        # One packed-only reference, and one that the loose file shadows
+        with open(os.path.join(repo.git_dir(), "packed-refs"), "w") as f:
+            f.write("# pack-refs with: peeled fully-peeled sorted \n")
+            f.write(f"{commit_id} refs/tags/loose\n")
+            f.write(f"{commit_id} refs/tags/packed\n")
+
+        names = [ref.name for ref in repo.references()]
+        assert "refs/tags/packed" in names
+        assert repo.reference_count() == len(names)
+
+    def test_iter_references_reads_lazily(self, fresh_repo_with_commit):
+        """Test that iter_references reads each reference when it reaches it."""
+        repo, commit_id = fresh_repo_with_commit
+        repo.create_reference("refs/tags/a", commit_id, is_symbolic=False, force=False)
+        repo.create_reference("refs/tags/b", commit_id, is_symbolic=False, force=False)
+
+        it = repo.iter_references()
+        names = []
+        for ref in it:
+            names.append(ref.name)
+            if ref.name == "refs/tags/a":
+                break
+
+        # Changing a reference the iterator hasn't reached yet is picked up
+        repo.create_reference("refs/tags/b", "refs/tags/a", is_symbolic=True, force=True)
+        rest = list(it)
+        assert [ref.name for ref in rest] == ["refs/tags/b"]
+        assert rest[0].is_symbolic
+        assert rest[0].target == "refs/tags/a"
+
+    def test_references_columns(self, repo_with_commit):
+        """Test references_columns method."""
+        repo, commit_id = repo_with_commit
+
+        names, targets, symbolic = repo.references_columns()
+
+        # The columns line up with the list of reference objects
+        refs = repo.references()
+        assert names == [ref.name for ref in refs]
+        assert targets == [ref.target for ref in refs]
+        assert symbolic == [ref.is_symbolic for ref in refs]
+        assert all(isinstance(flag, bool) for flag in symbolic)
+
     def test_reference_names(self, repo_with_commit):
         """Test reference_names method."""
         repo, commit_id = repo_with_commit
@@ -93,9 +126,9 @@ class TestReferenceOperations:
         with pytest.raises(Exception):
             repo.find_reference("refs/heads/nonexistent")
 
-    def test_create_reference(self, repo_with_commit):
+    def test_create_reference(self, fresh_repo_with_commit):
         """Test create_reference method."""
-        repo, commit_id = repo_with_commit
+        repo, commit_id = fresh_repo_with_commit
         
         # Create a new reference (direct)
         new_ref = repo.create_reference("refs/tags/test-tag", commit_id, is_symbolic=False, force=False)
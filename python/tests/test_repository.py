@@ -3,274 +3,324 @@ Tests for the gitoxide Repository functionality.
 """
 
 import os
-import tempfile
+from collections import namedtuple
+
 import pytest
 import gitoxide
 
 
+def _commit(repo, reference, message, parents):
+    """Commit the empty tree to reference and return the commit ID."""
+    # Only the shape of the history matters, so like `git commit --allow-empty`
+    # no file is written; the commit is created in-process rather than by git
+    tree_id = repo.write_tree([])
+    return repo.commit(reference, message, tree_id, parents,
+                       author_name="Test User",
+                       author_email="test@example.com")
+
+
+@pytest.fixture(scope="module")
+def branches(tmp_path_factory):
+    """
+    Build a repository whose history forks three ways after the initial commit.
+
+    HEAD gets a second commit and refs/heads/branch2 and refs/heads/branch3
+    get siblings of it, so the merge-base and rev-parse tests can share one
+    read-only repository and object database.
+    Returns (repo, initial_commit, head_commit, branch2_commit, branch3_commit).
+    """
+    repo_dir = str(tmp_path_factory.mktemp("branches"))
+    repo = gitoxide.Repository.init(repo_dir, bare=False)
+    initial_commit = _commit(repo, "HEAD", "Initial commit", [])
+    head_commit = _commit(repo, "HEAD", "Second commit", [initial_commit])
+    branch2_commit = _commit(repo, "refs/heads/branch2", "Branch 2 commit", [initial_commit])
+    branch3_commit = _commit(repo, "refs/heads/branch3", "Branch 3 commit", [initial_commit])
+    return repo, initial_commit, head_commit, branch2_commit, branch3_commit
+
+
+@pytest.fixture(scope="module")
+def non_repo_path(tmp_path_factory):
+    """An empty directory that is not a Git repository."""
+    return str(tmp_path_factory.mktemp("nonrepo"))
+
+
+Dag = namedtuple("Dag", "repo head a b c d e f")
+
+
+@pytest.fixture(scope="module")
+def dag(tmp_path_factory):
+    """
+    Build a history with a merge of a long side and a short side.
+
+    HEAD merges A and F; A descends from E through D, C and B, while F is a
+    direct child of E, so E is the only merge base of A and F:
+
+        HEAD -> A -> B -> C -> D -> E
+        HEAD -> F ------------------> E
+    """
+    repo_dir = str(tmp_path_factory.mktemp("dag"))
+    repo = gitoxide.Repository.init(repo_dir, bare=False)
+    e = _commit(repo, "HEAD", "E", [])
+    d = _commit(repo, "HEAD", "D", [e])
+    c = _commit(repo, "HEAD", "C", [d])
+    b = _commit(repo, "HEAD", "B", [c])
+    a = _commit(repo, "HEAD", "A", [b])
+    f = _commit(repo, "refs/heads/side", "F", [e])
+    head = _commit(repo, "HEAD", "Merge side", [a, f])
+    return Dag(repo, head, a, b, c, d, e, f)
+
+
 class TestRepository:
     """Tests for the Repository class."""
 
-    def test_init_regular_repo(self):
+    def test_init_regular_repo(self, tmp_path):
         """Test initializing a regular repository."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a regular repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
+        temp_dir = str(tmp_path)
+        # Initialize a regular repository
+        repo = gitoxide.Repository.init(temp_dir, bare=False)
 
-            # Check repository properties
-            assert os.path.isdir(repo.git_dir())
-            assert repo.work_dir() is not None
-            assert not repo.is_bare()
+        # Check repository properties
+        assert os.path.isdir(repo.git_dir())
+        assert repo.work_dir() is not None
+        assert not repo.is_bare()
 
-            # Try to open the repository again
-            reopened = gitoxide.Repository.open(temp_dir)
-            assert reopened.git_dir() == repo.git_dir()
+        # Try to open the repository again
+        reopened = gitoxide.Repository.open(temp_dir)
+        assert reopened.git_dir() == repo.git_dir()
 
-    def test_init_bare_repo(self):
+    def test_init_bare_repo(self, tmp_path):
         """Test initializing a bare repository."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            bare_path = os.path.join(temp_dir, "bare.git")
+        temp_dir = str(tmp_path)
+        bare_path = os.path.join(temp_dir, "bare.git")
 
-            # Initialize a bare repository
-            repo = gitoxide.Repository.init(bare_path, bare=True)
+        # Initialize a bare repository
+        repo = gitoxide.Repository.init(bare_path, bare=True)
 
-            # Check repository properties
-            assert os.path.isdir(repo.git_dir())
-            assert repo.work_dir() is None
-            assert repo.is_bare()
+        # Check repository properties
+        assert os.path.isdir(repo.git_dir())
+        assert repo.work_dir() is None
+        assert repo.is_bare()
 
-            # Try to open the repository again
-            reopened = gitoxide.Repository.open(bare_path)
-            assert reopened.git_dir() == repo.git_dir()
+        # Try to open the repository again
+        reopened = gitoxide.Repository.open(bare_path)
+        assert reopened.git_dir() == repo.git_dir()
 
-    def test_open_nonexistent_repo(self):
+    def test_open_nonexistent_repo(self, non_repo_path):
         """Test opening a non-existent repository."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            non_repo_path = os.path.join(temp_dir, "nonexistent")
-            os.makedirs(non_repo_path)
-
-            # Attempting to open a directory that's not a Git repository should raise an error
-            with pytest.raises(Exception) as excinfo:
-                gitoxide.Repository.open(non_repo_path)
-            assert "does not appear to be a git repository" in str(
-                excinfo.value)
+        # Attempting to open a directory that's not a Git repository should raise an error
+        with pytest.raises(Exception) as excinfo:
+            gitoxide.Repository.open(non_repo_path)
+        assert "does not appear to be a git repository" in str(
+            excinfo.value)
 
-    def test_head_on_new_repo(self):
+    def test_head_on_new_repo(self, tmp_path):
         """Test getting HEAD on a new repository."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-
-            # A new repo should have HEAD pointing to refs/heads/master or refs/heads/main,
-            # but might throw an error if HEAD is not set
-            try:
-                head = repo.head()
-                assert head.startswith("refs/heads/")
-            except Exception as e:
-                assert "HEAD is not set" in str(e)
-
-    def test_merge_bases(self):
+        temp_dir = str(tmp_path)
+        repo = gitoxide.Repository.init(temp_dir, bare=False)
+
+        # A new repo should have HEAD pointing to refs/heads/master or refs/heads/main,
+        # but might throw an error if HEAD is not set
+        try:
+            head = repo.head()
+            assert head.startswith("refs/heads/")
+        except Exception as e:
+            assert "HEAD is not set" in str(e)
+
+    def test_merge_bases(self, branches):
         """Test finding merge bases between commits."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a new repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-
-            # Print available methods to debug
-            print("Available methods:", dir(repo))
-
-            # We need to create a commit history with merge bases
-            # Set up git user info
-            os.system(f"cd {temp_dir} && git config user.name 'Test User'")
-            os.system(
-                f"cd {temp_dir} && git config user.email 'test@example.com'")
-
-            # Create initial commit
-            os.system(
-                f"cd {temp_dir} && echo 'Initial content' > file.txt && git add file.txt && git commit -m 'Initial commit'")
-
-            # Get the initial commit ID
-            initial_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Create two branches from initial commit
-            os.system(f"cd {temp_dir} && git checkout -b branch1")
-            os.system(
-                f"cd {temp_dir} && echo 'Branch 1 content' >> file.txt && git add file.txt && git commit -m 'Branch 1 commit'")
-            branch1_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            os.system(
-                f"cd {temp_dir} && git checkout -b branch2 {initial_commit}")
-            os.system(
-                f"cd {temp_dir} && echo 'Branch 2 content' >> file.txt && git add file.txt && git commit -m 'Branch 2 commit'")
-            branch2_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Test merge_bases
-            # The merge base of branch1_commit and branch2_commit should be initial_commit
-            merge_bases = repo.merge_bases(branch1_commit, [branch2_commit])
-            assert len(merge_bases) == 1
-            assert merge_bases[0] == initial_commit
-
-            # Test with invalid commit ID
-            with pytest.raises(Exception) as excinfo:
-                repo.merge_bases("invalidcommitid", [branch1_commit])
-            assert "Invalid object ID" in str(excinfo.value)
-
-    def test_merge_base(self):
+        repo, initial_commit, branch1_commit, branch2_commit, _ = branches
+
+        # Test merge_bases
+        # The merge base of branch1_commit and branch2_commit should be initial_commit
+        merge_bases = repo.merge_bases(branch1_commit, [branch2_commit])
+        assert len(merge_bases) == 1
+        assert merge_bases[0] == initial_commit
+
+        # Test with invalid commit ID
+        with pytest.raises(Exception) as excinfo:
+            repo.merge_bases("invalidcommitid", [branch1_commit])
+        assert "Invalid object ID" in str(excinfo.value)
+
+    def test_merge_bases_bytes(self, branches):
+        """Test finding merge bases with raw object IDs."""
+        repo, initial_commit, branch1_commit, branch2_commit, _ = branches
+
+        # Raw IDs go in and come back out without hex formatting
+        merge_bases = repo.merge_bases_bytes(bytes.fromhex(branch1_commit),
+                                             [bytes.fromhex(branch2_commit)])
+        assert merge_bases == [bytes.fromhex(initial_commit)]
+
+        # The hex API accepts raw IDs too
+        assert repo.merge_bases(bytes.fromhex(branch1_commit), [branch2_commit]) == [initial_commit]
+        assert repo.merge_base(bytes.fromhex(branch1_commit), branch2_commit) == initial_commit
+
+        # Test with an ID of the wrong length
+        with pytest.raises(Exception) as excinfo:
+            repo.merge_bases_bytes(b"\x00" * 3, [bytes.fromhex(branch1_commit)])
+        assert "Invalid object ID" in str(excinfo.value)
+
+    def test_merge_base(self, branches):
         """Test finding the best merge base between two commits."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a new repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-
-            # Set up git user info
-            os.system(f"cd {temp_dir} && git config user.name 'Test User'")
-            os.system(
-                f"cd {temp_dir} && git config user.email 'test@example.com'")
-
-            # Create initial commit
-            os.system(
-                f"cd {temp_dir} && echo 'Initial content' > file.txt && git add file.txt && git commit -m 'Initial commit'")
-
-            # Get the initial commit ID
-            initial_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Create two branches from initial commit
-            os.system(f"cd {temp_dir} && git checkout -b branch1")
-            os.system(
-                f"cd {temp_dir} && echo 'Branch 1 content' >> file.txt && git add file.txt && git commit -m 'Branch 1 commit'")
-            branch1_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            os.system(
-                f"cd {temp_dir} && git checkout -b branch2 {initial_commit}")
-            os.system(
-                f"cd {temp_dir} && echo 'Branch 2 content' >> file.txt && git add file.txt && git commit -m 'Branch 2 commit'")
-            branch2_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Test merge_base
-            # The merge base of branch1_commit and branch2_commit should be initial_commit
-            merge_base = repo.merge_base(branch1_commit, branch2_commit)
-            assert merge_base == initial_commit
-
-            # Test with invalid commit ID
-            with pytest.raises(Exception) as excinfo:
-                repo.merge_base("invalidcommitid", branch1_commit)
-            assert "Invalid object ID" in str(excinfo.value)
-
-    def test_rev_parse(self):
+        repo, initial_commit, branch1_commit, branch2_commit, _ = branches
+
+        # Test merge_base
+        # The merge base of branch1_commit and branch2_commit should be initial_commit
+        merge_base = repo.merge_base(branch1_commit, branch2_commit)
+        assert merge_base == initial_commit
+
+        # Test with invalid commit ID
+        with pytest.raises(Exception) as excinfo:
+            repo.merge_base("invalidcommitid", branch1_commit)
+        assert "Invalid object ID" in str(excinfo.value)
+
+    def test_merge_base_pairs(self, branches):
+        """Test answering several merge-base queries with one shared graph."""
+        repo, initial_commit, branch1_commit, branch2_commit, branch3_commit = branches
+
+        pairs = [
+            (branch1_commit, branch2_commit),
+            (branch2_commit, branch3_commit),
+            (initial_commit, branch3_commit),
+            (branch1_commit, branch1_commit),
+        ]
+        # Each answer matches the one merge_base gives for the pair on its own
+        assert repo.merge_base_pairs(pairs) == [repo.merge_base(a, b) for a, b in pairs]
+        assert repo.merge_base_pairs(pairs) == [initial_commit, initial_commit,
+                                                initial_commit, branch1_commit]
+        assert repo.merge_base_pairs([]) == []
+
+        # Test with invalid commit ID
+        with pytest.raises(Exception) as excinfo:
+            repo.merge_base_pairs([("invalidcommitid", branch1_commit)])
+        assert "Invalid object ID" in str(excinfo.value)
+
+    def test_rev_parse(self, branches):
         """Test parsing revision specifications."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a new repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-
-            # Set up git user info
-            os.system(f"cd {temp_dir} && git config user.name 'Test User'")
-            os.system(
-                f"cd {temp_dir} && git config user.email 'test@example.com'")
-
-            # Create initial commit
-            os.system(
-                f"cd {temp_dir} && echo 'Initial content' > file.txt && git add file.txt && git commit -m 'Initial commit'")
-
-            # Get the initial commit ID using git rev-parse
-            initial_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Create a second commit
-            os.system(
-                f"cd {temp_dir} && echo 'Second content' >> file.txt && git add file.txt && git commit -m 'Second commit'")
-            second_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Test various revision specifications
-            # HEAD should resolve to the second commit
-            head_commit = repo.rev_parse("HEAD")
-            assert head_commit == second_commit
-
-            # HEAD^ should resolve to the first commit
-            parent_commit = repo.rev_parse("HEAD^")
-            assert parent_commit == initial_commit
-
-            # HEAD~1 should also resolve to the first commit
-            parent_commit2 = repo.rev_parse("HEAD~1")
-            assert parent_commit2 == initial_commit
-
-            # Full SHA should resolve to itself
-            full_sha = repo.rev_parse(second_commit)
-            assert full_sha == second_commit
-
-            # Test with an invalid revision specification
-            with pytest.raises(Exception) as excinfo:
-                repo.rev_parse("non-existent-branch")
-            assert "Failed to parse revision" in str(excinfo.value)
-
-    def test_merge_base_octopus(self):
+        repo, initial_commit, second_commit, _, _ = branches
+
+        # Test various revision specifications
+        # HEAD should resolve to the second commit
+        head_commit = repo.rev_parse("HEAD")
+        assert head_commit == second_commit
+
+        # HEAD^ should resolve to the first commit
+        parent_commit = repo.rev_parse("HEAD^")
+        assert parent_commit == initial_commit
+
+        # HEAD~1 should also resolve to the first commit
+        parent_commit2 = repo.rev_parse("HEAD~1")
+        assert parent_commit2 == initial_commit
+
+        # Full SHA should resolve to itself
+        full_sha = repo.rev_parse(second_commit)
+        assert full_sha == second_commit
+
+        # Test with an invalid revision specification
+        with pytest.raises(Exception) as excinfo:
+            repo.rev_parse("non-existent-branch")
+        assert "Failed to parse revision" in str(excinfo.value)
+
+    def test_merge_base_linear_ancestor(self, dag):
+        """Test that an ancestor is its own merge base with a descendant."""
+        repo = dag.repo
+
+        assert repo.merge_base(dag.head, dag.c) == dag.c
+        assert repo.merge_base(dag.c, dag.b) == dag.c
+        assert repo.merge_base(dag.head, dag.f) == dag.f
+
+        # The two sides of the merge only meet at the root
+        assert repo.merge_base(dag.a, dag.f) == dag.e
+
+    def test_merge_bases_multi(self, dag):
+        """Test merge bases of a commit against several other commits."""
+        repo = dag.repo
+
+        # D is reachable from B and better than the root both reach
+        assert repo.merge_bases(dag.b, [dag.d, dag.f]) == [dag.d]
+        assert repo.merge_bases(dag.a, [dag.f]) == [dag.e]
+
+        # Neither C nor F is an ancestor of the other, so both are best
+        assert sorted(repo.merge_bases(dag.head, [dag.c, dag.f])) == sorted([dag.c, dag.f])
+
+    def test_rev_parse_topology(self, dag):
+        """Test navigating the parents of a merge commit."""
+        repo = dag.repo
+
+        assert repo.rev_parse("HEAD") == dag.head
+        assert repo.rev_parse("HEAD^1") == dag.a
+        assert repo.rev_parse("HEAD^2") == dag.f
+        assert repo.rev_parse("HEAD~3") == dag.c
+        assert repo.rev_parse("HEAD^2^") == dag.e
+        assert repo.rev_parse("side") == dag.f
+
+    def test_merge_base_octopus(self, branches):
         """Test finding the best merge base among multiple commits."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a new repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-
-            # Set up git user info
-            os.system(f"cd {temp_dir} && git config user.name 'Test User'")
-            os.system(
-                f"cd {temp_dir} && git config user.email 'test@example.com'")
-
-            # Create initial commit
-            os.system(
-                f"cd {temp_dir} && echo 'Initial content' > file.txt && git add file.txt && git commit -m 'Initial commit'")
-
-            # Get the initial commit ID
-            initial_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Create three branches from the initial commit
-
-            # Branch 1
-            os.system(f"cd {temp_dir} && git checkout -b branch1")
-            os.system(
-                f"cd {temp_dir} && echo 'Branch 1 content' >> file.txt && git add file.txt && git commit -m 'Branch 1 commit'")
-            branch1_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Branch 2
-            os.system(
-                f"cd {temp_dir} && git checkout -b branch2 {initial_commit}")
-            os.system(
-                f"cd {temp_dir} && echo 'Branch 2 content' >> file.txt && git add file.txt && git commit -m 'Branch 2 commit'")
-            branch2_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Branch 3
-            os.system(
-                f"cd {temp_dir} && git checkout -b branch3 {initial_commit}")
-            os.system(
-                f"cd {temp_dir} && echo 'Branch 3 content' >> file.txt && git add file.txt && git commit -m 'Branch 3 commit'")
-            branch3_commit = os.popen(
-                f"cd {temp_dir} && git rev-parse HEAD").read().strip()
-
-            # Test merge_base_octopus with all three branches
-            # The merge base of all three branches should be the initial commit
-            merge_base = repo.merge_base_octopus(
-                [branch1_commit, branch2_commit, branch3_commit])
-            assert merge_base == initial_commit
-
-            # Test with only two branches
-            merge_base_two = repo.merge_base_octopus(
-                [branch1_commit, branch2_commit])
-            assert merge_base_two == initial_commit
-
-            # Test with a single commit - should return that commit
-            merge_base_one = repo.merge_base_octopus([branch1_commit])
-            assert merge_base_one == branch1_commit
-
-            # Test with empty list
-            with pytest.raises(Exception) as excinfo:
-                repo.merge_base_octopus([])
-            assert "No commits provided" in str(excinfo.value)
-
-            # Test with invalid commit ID
-            with pytest.raises(Exception) as excinfo:
-                repo.merge_base_octopus(["invalidcommitid", branch1_commit])
-            assert "Invalid object ID" in str(excinfo.value)
+        repo, initial_commit, branch1_commit, branch2_commit, branch3_commit = branches
+
+        # Test merge_base_octopus with all three branches
+        # The merge base of all three branches should be the initial commit
+        merge_base = repo.merge_base_octopus(
+            [branch1_commit, branch2_commit, branch3_commit])
+        assert merge_base == initial_commit
+
+        # Test with only two branches
+        merge_base_two = repo.merge_base_octopus(
+            [branch1_commit, branch2_commit])
+        assert merge_base_two == initial_commit
+
+        # Test with a single commit - should return that commit
+        merge_base_one = repo.merge_base_octopus([branch1_commit])
+        assert merge_base_one == branch1_commit
+
+        # Test with empty list
+        with pytest.raises(Exception) as excinfo:
+            repo.merge_base_octopus([])
+        assert "No commits provided" in str(excinfo.value)
+
+        # Test with invalid commit ID
+        with pytest.raises(Exception) as excinfo:
+            repo.merge_base_octopus(["invalidcommitid", branch1_commit])
+        assert "Invalid object ID" in str(excinfo.value)
+
+    def test_path_bytes(self, tmp_path):
+        """Test getting repository paths as bytes."""
+        temp_dir = str(tmp_path)
+        repo = gitoxide.Repository.init(temp_dir, bare=False)
+        assert repo.git_dir_bytes() == os.fsencode(repo.git_dir())
+        assert repo.work_dir_bytes() == os.fsencode(repo.work_dir())
+
+        bare_repo = gitoxide.Repository.init(os.path.join(temp_dir, "bare.git"), bare=True)
+        assert bare_repo.work_dir_bytes() is None
+
+    def test_open_bare(self, tmp_path):
+        """Test opening repositories by their git directory."""
+        temp_dir = str(tmp_path)
+        bare_path = os.path.join(temp_dir, "bare.git")
+        gitoxide.Repository.init(bare_path, bare=True)
+
+        repo = gitoxide.Repository.open_bare(bare_path)
+        assert repo.is_bare()
+        assert repo.work_dir() is None
+
+        # A working directory is not probed for a .git directory
+        work_path = os.path.join(temp_dir, "work")
+        created = gitoxide.Repository.init(work_path, bare=False)
+        with pytest.raises(gitoxide.RepositoryError):
+            gitoxide.Repository.open_bare(work_path)
+
+        reopened = gitoxide.Repository.open_bare(created.git_dir())
+        assert reopened.git_dir() == created.git_dir()
+
+    def test_errors_submodule(self, non_repo_path):
+        """Test that gitoxide.errors can be imported and groups the error types."""
+        import gitoxide.errors
+        from gitoxide.errors import GitoxideError, RepositoryError
+
+        assert RepositoryError is gitoxide.RepositoryError
+        assert issubclass(RepositoryError, GitoxideError)
+        assert gitoxide.errors.FSError is gitoxide.FSError
+        assert sorted(gitoxide.errors.__all__) == sorted(
+            name for name in gitoxide.__all__ if name.endswith("Error"))
+
+        with pytest.raises(gitoxide.errors.RepositoryError):
+            gitoxide.Repository.open(non_repo_path)
@@ -3,51 +3,40 @@ Tests for the shallow repository operations in gitoxide.
 """
 
 import os
-import tempfile
 import pytest
 import gitoxide
 
 
+@pytest.fixture(scope="class")
+def repo(tmp_path_factory):
+    """Initialize one regular repository for the read-only checks of a class."""
+    return gitoxide.Repository.init(str(tmp_path_factory.mktemp("repo")), bare=False)
+
+
 class TestShallowOperations:
     """Tests for shallow repository operations."""
 
-    def test_is_shallow(self):
+    def test_is_shallow(self, repo):
         """Test the is_shallow method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a regular repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-            
-            # A new repository should not be shallow
-            assert not repo.is_shallow()
+        # A new repository should not be shallow
+        assert not repo.is_shallow()
             
-    def test_shallow_file(self):
+    def test_shallow_file(self, repo):
         """Test the shallow_file method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a regular repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
+        # Check that shallow_file returns a path
+        shallow_path = repo.shallow_file()
+        assert isinstance(shallow_path, str)
+        assert "shallow" in shallow_path
             
-            # Check that shallow_file returns a path
-            shallow_path = repo.shallow_file()
-            assert isinstance(shallow_path, str)
-            assert "shallow" in shallow_path
-            
-    def test_shallow_commits(self):
+    def test_shallow_commits(self, repo):
         """Test the shallow_commits method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a regular repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-            
-            # A new repository shouldn't have shallow commits
-            result = repo.shallow_commits()
-            assert result is None
+        # A new repository shouldn't have shallow commits
+        result = repo.shallow_commits()
+        assert result is None
 
-    def test_object_hash(self):
+    def test_object_hash(self, repo):
         """Test the object_hash method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initialize a regular repository
-            repo = gitoxide.Repository.init(temp_dir, bare=False)
-            
-            # Check the hash algorithm (should be SHA-1 by default)
-            hash_algo = repo.object_hash()
-            assert isinstance(hash_algo, str)
-            assert hash_algo.lower() == "sha1"
\ No newline at end of file
+        # Check the hash algorithm (should be SHA-1 by default)
+        hash_algo = repo.object_hash()
+        assert isinstance(hash_algo, str)
+        assert hash_algo.lower() == "sha1"
\ No newline at end of file